@@ -16,23 +16,39 @@ st.set_page_config(page_title="UAV Mission Editor", page_icon="🛸", layout="wi
 apply_custom_styles()
 
 # --- Session State Initialization ---
-if 'page' not in st.session_state: st.session_state.page = 'home'
-if 'current_project' not in st.session_state: st.session_state.current_project = None
-if 'project_data' not in st.session_state: st.session_state.project_data = None
-if 'current_mission_index' not in st.session_state: st.session_state.current_mission_index = None
-if 'editing_mission_type' not in st.session_state: st.session_state.editing_mission_type = None
+SESSION_DEFAULTS = {
+    'page': 'home',
+    'current_project': None,
+    'project_data': None,
+    'current_mission_index': None,
+    'editing_mission_type': None,
+}
+
+def init_state():
+    """Seeds missing session keys; existing values survive reruns untouched."""
+    for key, default in SESSION_DEFAULTS.items():
+        if key not in st.session_state: st.session_state[key] = default
+
+init_state()
 
 # --- Main Router ---
+@st.cache_resource
+def get_router():
+    """Page name -> render function, built once per server process."""
+    return {
+        'home': render_home,
+        'settings': render_settings,
+        'project_overview': render_project_overview,
+        'mission_editor': render_mission_editor,
+        'mission_type_editor': render_mission_type_editor,
+        'agentic_creation': render_agentic_creation,
+        'generation_progress': render_generation_progress,
+        'visual_state_editor': render_visual_state_editor,
+    }
+
 # We use a unique key based on the page to force Streamlit to recreate the container
 # This prevents "ghost" elements from previous pages appearing if the new page is shorter
 main_container = st.container(key=st.session_state.page)
 with main_container:
-    if st.session_state.page == 'home': render_home()
-    elif st.session_state.page == 'settings': render_settings()
-    elif st.session_state.page == 'project_overview': render_project_overview()
-    elif st.session_state.page == 'mission_editor': render_mission_editor()
-    elif st.session_state.page == 'mission_type_editor': render_mission_type_editor()
-    elif st.session_state.page == 'agentic_creation': render_agentic_creation()
-    elif st.session_state.page == 'generation_progress': render_generation_progress()
-    elif st.session_state.page == 'visual_state_editor': render_visual_state_editor()
-
+    render_page = get_router().get(st.session_state.page)
+    if render_page: render_page()
@@ -0,0 +1,28 @@
+import asyncio
+import threading
+import weakref
+from google import genai
+
+# Clients per event loop, then per API key. A client's async connection pool is bound to the loop
+# that opened it, so it must not be reused by another asyncio.run call or another worker thread's loop.
+_clients_by_loop = weakref.WeakKeyDictionary()
+_clients_lock = threading.Lock()
+# Used outside of any event loop (sync calls only); the sync httpx pool is thread-safe
+_loopless_clients: dict = {}
+
+
+def get_genai_client(api_key: str) -> genai.Client:
+    """
+    Returns the client for `api_key` on the running event loop, so all requests of one loop share
+    its connection pool. Entries go away together with their loop.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    with _clients_lock:
+        clients = _loopless_clients if loop is None else _clients_by_loop.setdefault(loop, {})
+        client = clients.get(api_key)
+        if client is None:
+            client = clients[api_key] = genai.Client(api_key=api_key)
+    return client
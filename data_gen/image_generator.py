@@ -1,27 +1,42 @@
-from google import genai
 from google.genai import types
 from google.genai.errors import ServerError
 from PIL import Image
-import os
-import time
+from .rate_limiter import IMAGE_LIMITER, retry_delay
+from .clients import get_genai_client
+import asyncio
+
+def _write_bytes(path: str, data: bytes) -> None:
+    with open(path, "wb") as f:
+        f.write(data)
 
 class ImageGenerator:
     #gemini-3-pro-image-preview as expensive model
     # gemini-2.5-flash-image as cheaper model
     def __init__(self, api_key: str, model: str = "gemini-2.5-flash-image") -> Image:
-        self.client = genai.Client(api_key=api_key)
+        self.api_key = api_key
         self.model = model
 
-    def generate_image(self, prompt: str, output_path: str, aspect_ratio: str, resolution: str) -> None:
+    @property
+    def client(self):
+        """The client of the running event loop (see get_genai_client)."""
+        return get_genai_client(self.api_key)
+
+    def generate_image(self, prompt: str, output_path: str, aspect_ratio: str, resolution: str) -> bytes:
+        """Synchronous wrapper around generate_image_async for non-async callers."""
+        return asyncio.run(self.generate_image_async(prompt, output_path, aspect_ratio, resolution))
+
+    async def generate_image_async(self, prompt: str, output_path: str, aspect_ratio: str, resolution: str) -> bytes:
         """
         aspect_ratio = "16:9" # "1:1","2:3","3:2","3:4","4:3","4:5","5:4","9:16","16:9","21:9"
 
         resolution = "2K" # "1K", "2K", "4K"
         """
-        max_retries = 10
+        max_retries = 6
         for i in range(max_retries):
             try:
-                response = self.client.models.generate_content(
+                # Wait for quota before hitting the API instead of bouncing off rate limits
+                await IMAGE_LIMITER.acquire()
+                response = await self.client.aio.models.generate_content(
                     model=self.model,
                     contents=[prompt],
                     config=types.GenerateContentConfig(
@@ -31,18 +46,19 @@ class ImageGenerator:
                     )
                 )
                 for part in response.parts:
-                    if image := part.as_image():
-                        if directory := os.path.dirname(output_path):
-                            os.makedirs(directory, exist_ok=True)
-                        image.save(output_path)
+                    blob = part.inline_data
+                    if blob and blob.data and (blob.mime_type or "").startswith("image/"):
+                        # Write the encoded bytes as returned by the API, no decode/re-encode,
+                        # from a worker thread so the event loop keeps serving other requests
+                        await asyncio.to_thread(_write_bytes, output_path, blob.data)
                         #print(f"Image saved to {output_path}")
-                        return image
+                        return blob.data
                 raise ValueError("No image generated from the prompt.")
             except ServerError as e:
                 if "503" in str(e) or "UNAVAILABLE" in str(e):
-                    wait_time = (i + 1) * 5
-                    print(f"ImageGenerator: Server overloaded (503). Retrying in {wait_time}s... (Attempt {i+1}/{max_retries})")
-                    time.sleep(wait_time)
+                    wait_time = retry_delay(i)
+                    print(f"ImageGenerator: Server overloaded (503). Retrying in {wait_time:.1f}s... (Attempt {i+1}/{max_retries})")
+                    await asyncio.sleep(wait_time)
                 else:
                     raise e
         
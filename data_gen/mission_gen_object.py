@@ -1,4 +1,5 @@
 from enum import Enum
+from functools import cached_property
 from pydantic import BaseModel, Field
 from typing import List, Tuple, Optional
 
@@ -27,32 +28,32 @@ class DetailedImagePrompt(BaseModel):
     lighting_and_style: str = Field(..., description="Camera settings (e.g., 'Cinematic drone shot, 4k').")
     landmarks: List[Landmark] = Field(..., description="List of all key objects that MUST appear.")
 
-    @property
+    @cached_property
     def full_rendering_prompt(self) -> str:
         """
         Constructs a cohesive prompt ensuring the House is the canvas for the Number.
         """
-        # 1. Build the Landmark Text Phrases
-        landmark_phrases = []
-        for l in self.landmarks:
+        # Assemble: "A [House], [displaying Number], [with Person nearby]. [Env]. [Light]."
+        # This sentence structure forces the House to be the main subject.
+        # All fragments go into one list and are joined once.
+        parts = [self.subject_description, ", "]
+        for i, l in enumerate(self.landmarks):
+            if i:
+                parts.append(", ")
             if l.category == LandmarkCategory.HOUSE_NUMBER and l.text_content:
                 # Binds the number to the house facade
-                landmark_phrases.append(f"clearly displaying the number '{l.text_content}' which is {l.visual_attributes}")
+                parts.append(f"clearly displaying the number '{l.text_content}' which is {l.visual_attributes}")
             else:
-                landmark_phrases.append(f"with a {l.name} ({l.visual_attributes}) nearby")
-
-        # 2. Assemble: "A [House] [displaying Number] [with Person nearby]. [Env]. [Light]."
-        # This sentence structure forces the House to be the main subject.
-        integration_phrase = ", ".join(landmark_phrases)
-        
-        return f"{self.subject_description}, {integration_phrase}. {self.environment_context}. {self.lighting_and_style}."
+                parts.append(f"with a {l.name} ({l.visual_attributes}) nearby")
+        parts.append(f". {self.environment_context}. {self.lighting_and_style}.")
+        return "".join(parts)
 
 class GroundImagePrompt(BaseModel):
     surface_texture: str
     obstacles_and_debris: str
     lighting_angle: str
 
-    @property
+    @cached_property
     def full_rendering_prompt(self) -> str:
         return f"Top-down drone view looking at {self.surface_texture}. {self.obstacles_and_debris}. {self.lighting_angle}."
 
@@ -2,12 +2,21 @@ from data_gen.image_generator import ImageGenerator
 from data_gen.scene_generator import SceneGenerator
 from data_gen.validator import MissionValidator
 from data_gen.mission_gen_object import Mission, Waypoint, MissionType, LandmarkCategory
-import time
+import asyncio
+import os
 import uuid
-import random
 from google.genai.errors import ServerError
 from data_gen.validator import ValidationResult
-from typing import Optional
+from typing import Optional, List, Tuple
+
+# Caps how many image requests are in flight against the API at once.
+MAX_CONCURRENT_IMAGE_REQUESTS = 5
+
+# Worker counts per stage for run_batch, and the size of the queues between stages.
+SCENE_WORKERS = 2
+IMAGE_WORKERS = 5
+VALIDATION_WORKERS = 3
+STAGE_QUEUE_SIZE = 2
 
 class MissionGenPipeline:
     def __init__(self, api_key: str, 
@@ -20,37 +29,62 @@ class MissionGenPipeline:
         self.validator_model = MissionValidator(api_key, model= verification_vlm)
         self.waypoints_per_mission = waypoints_per_mission
 
-    def generate_waypoint_entry(self, waypoint: Waypoint, mission_id: str, waypoint_id: str) -> dict:
+    def generate_waypoint_entry(self, waypoint: Waypoint, mission_id: str, waypoint_id: str) -> Tuple[dict, List[tuple]]:
+        """
+        Builds the waypoint entry and the image jobs needed to render its media.
+        Each job is a (prompt, output_path, aspect_ratio, resolution) tuple.
+        """
         media_entries = {}
         media_entries['forward_image.png'] = waypoint.forward_image.full_rendering_prompt
         media_entries['ground_image.png'] = waypoint.ground_image.full_rendering_prompt
         if waypoint.secondary_ground_image:
             media_entries['secondary_ground_image.png'] = waypoint.secondary_ground_image.full_rendering_prompt
         output_base_path = f"outputs/{mission_id}/{waypoint_id}"
+        # Create the waypoint directory once here, the image jobs only write files into it
+        os.makedirs(output_base_path, exist_ok=True)
+        image_jobs = []
         for filename, prompt in media_entries.items():
             output_path = f"{output_base_path}/{filename}"
             # Here we assume aspect_ratio and resolution are predefined or passed as parameters
             aspect_ratio = "16:9" if "forward" in filename else "1:1"
             resolution = "2K" if "forward" in filename else "1K"
-            #save image automatically
-            self.image_generator.generate_image(prompt, output_path, aspect_ratio, resolution)
+            image_jobs.append((prompt, output_path, aspect_ratio, resolution))
             
+        # Dump landmarks and pick up the first house number in a single pass
+        house_number = "N/A"
+        found_house_number = False
+        landmarks_dump = []
+        for l in waypoint.forward_image.landmarks:
+            landmarks_dump.append(l.model_dump())
+            if not found_house_number and l.category == LandmarkCategory.HOUSE_NUMBER:
+                house_number = l.text_content
+                found_house_number = True
+
         waypoint_entry = {
             "id": waypoint_id,
             "media": {f"{filename}": f"{output_base_path}/{filename}" for filename in media_entries.keys()},
             "is_target": waypoint.is_target,
             "ground_is_obstructed": waypoint.ground_is_obstructed,
-            "landmarks": [landmark.model_dump() for landmark in waypoint.forward_image.landmarks],
+            "landmarks": landmarks_dump,
             "gt_entities": {
-                "house_number": next((l.text_content for l in waypoint.forward_image.landmarks if l.category == LandmarkCategory.HOUSE_NUMBER), "N/A")
+                "house_number": house_number
             }
         }
-        return waypoint_entry
+        return waypoint_entry, image_jobs
 
+    async def _generate_image_job(self, job: tuple, semaphore: asyncio.Semaphore):
+        async with semaphore:
+            #save image automatically
+            return await self.image_generator.generate_image_async(*job)
 
     def generate_mission_entry(self, mission_obj: Mission, dataset_split: str) -> dict:
+        """Synchronous wrapper around generate_mission_entry_async."""
+        return asyncio.run(self.generate_mission_entry_async(mission_obj, dataset_split))
+
+    async def generate_mission_entry_async(self, mission_obj: Mission, dataset_split: str,
+                                           semaphore: Optional[asyncio.Semaphore] = None) -> dict:
         # Generate unique mission ID to avoid overwriting images
-        unique_id = f"mission_{int(time.time())}_{random.randint(1000, 9999)}"
+        unique_id = f"mission_{uuid.uuid4().hex[:12]}"
         
         mission_entry = {
             "id": unique_id,
@@ -62,36 +96,109 @@ class MissionGenPipeline:
             "waypoints": []
         }
 
+        image_jobs = []
         for i, waypoint in enumerate(mission_obj.waypoints):
-            waypoint_entry = self.generate_waypoint_entry(waypoint, mission_entry["id"], f"waypoint_{i+1:02d}")
+            waypoint_entry, waypoint_jobs = self.generate_waypoint_entry(waypoint, mission_entry["id"], f"waypoint_{i+1:02d}")
             mission_entry["waypoints"].append(waypoint_entry)
+            image_jobs.extend(waypoint_jobs)
+
+        # Render all images of the mission concurrently; each request keeps its own 503 retry loop.
+        semaphore = semaphore or asyncio.Semaphore(MAX_CONCURRENT_IMAGE_REQUESTS)
+        await asyncio.gather(*(self._generate_image_job(job, semaphore) for job in image_jobs))
                 
         return mission_entry
 
     def run_pipeline(self, mission_type_str: str, dataset_split: str = "sft_train") -> dict:
+        """Synchronous wrapper around run_pipeline_async for Streamlit callers."""
+        return asyncio.run(self.run_pipeline_async(mission_type_str, dataset_split))
+
+    async def run_pipeline_async(self, mission_type_str: str, dataset_split: str = "sft_train") -> dict:
         try:
             # 1. Generate Mission Scene
-            mission_json_str = self.scene_generator.generate_scene(mission_type_str, self.waypoints_per_mission)
+            mission_json_str = await self.scene_generator.generate_scene_async(mission_type_str, self.waypoints_per_mission)
             mission_obj = Mission.model_validate_json(mission_json_str)
 
             # 2. Generate Mission Entry with Images
-            mission_entry = self.generate_mission_entry(mission_obj, dataset_split)
+            mission_entry = await self.generate_mission_entry_async(mission_obj, dataset_split)
             
-            validation_result = self.validator_model.validate_mission(mission_entry, image_base_dir=".")
+            validation_result = await self.validator_model.validate_mission_async(mission_entry, image_base_dir=".")
 
             mission_entry['validation_result'] = validation_result.model_dump()
 
             return mission_entry
         except ServerError as e:
-            print(f"Pipeline failed after retries: {e}")
-            return {
-                "id": "failed",
-                "type": mission_type_str,
-                "dataset_split": dataset_split,
-                "validation_result": ValidationResult(
-                    mission_is_valid=False,
-                    confidence_score=0.0,
-                    needs_human_review=True,
-                    reasoning=f"Mission generation failed after 10 retries due to server overload: {str(e)}"
-                ).model_dump()
-            }
+            return self._failed_entry(mission_type_str, dataset_split, e)
+
+    @staticmethod
+    def _failed_entry(mission_type_str: str, dataset_split: str, error: Exception) -> dict:
+        cause = "after retries due to server overload" if isinstance(error, ServerError) else f"({type(error).__name__})"
+        print(f"Pipeline failed {cause}: {error}")
+        return {
+            "id": "failed",
+            "type": mission_type_str,
+            "dataset_split": dataset_split,
+            "validation_result": ValidationResult(
+                mission_is_valid=False,
+                confidence_score=0.0,
+                needs_human_review=True,
+                reasoning=f"Mission generation failed {cause}: {str(error)}"
+            ).model_dump()
+        }
+
+    def run_batch(self, n_missions: int, mission_type_str: str, dataset_split: str = "sft_train") -> List[dict]:
+        """Synchronous wrapper around run_batch_async."""
+        return asyncio.run(self.run_batch_async(n_missions, mission_type_str, dataset_split))
+
+    async def run_batch_async(self, n_missions: int, mission_type_str: str, dataset_split: str = "sft_train") -> List[dict]:
+        """
+        Generates n_missions missions with scene generation, image generation and validation
+        running as overlapping stages: while mission K renders its images, mission K+1 is being
+        described and mission K-1 is being validated.
+
+        Returns the mission entries in completion order (failed missions included).
+        """
+        image_queue = asyncio.Queue(maxsize=STAGE_QUEUE_SIZE)
+        validation_queue = asyncio.Queue(maxsize=STAGE_QUEUE_SIZE)
+        image_semaphore = asyncio.Semaphore(MAX_CONCURRENT_IMAGE_REQUESTS)
+        pending_scenes = iter(range(n_missions))
+        results = []
+
+        async def scene_worker():
+            # The shared iterator hands each mission index to exactly one worker
+            for _ in pending_scenes:
+                try:
+                    mission_json_str = await self.scene_generator.generate_scene_async(mission_type_str, self.waypoints_per_mission)
+                    await image_queue.put(Mission.model_validate_json(mission_json_str))
+                except Exception as e:
+                    # One bad mission (API error, unparsable scene, no image returned) must not end the batch
+                    results.append(self._failed_entry(mission_type_str, dataset_split, e))
+
+        async def image_worker():
+            while (mission_obj := await image_queue.get()) is not None:
+                try:
+                    mission_entry = await self.generate_mission_entry_async(mission_obj, dataset_split, image_semaphore)
+                    await validation_queue.put(mission_entry)
+                except Exception as e:
+                    results.append(self._failed_entry(mission_type_str, dataset_split, e))
+
+        async def validation_worker():
+            while (mission_entry := await validation_queue.get()) is not None:
+                try:
+                    validation_result = await self.validator_model.validate_mission_async(mission_entry, image_base_dir=".")
+                    mission_entry['validation_result'] = validation_result.model_dump()
+                    results.append(mission_entry)
+                except Exception as e:
+                    results.append(self._failed_entry(mission_type_str, dataset_split, e))
+
+        async def run_stage(workers, outbox: asyncio.Queue, n_consumers: int):
+            await asyncio.gather(*workers)
+            # One sentinel per downstream worker signals that the stage is drained
+            for _ in range(n_consumers):
+                await outbox.put(None)
+
+        await asyncio.gather(
+            run_stage([scene_worker() for _ in range(SCENE_WORKERS)], image_queue, IMAGE_WORKERS),
+            run_stage([image_worker() for _ in range(IMAGE_WORKERS)], validation_queue, VALIDATION_WORKERS),
+            *(validation_worker() for _ in range(VALIDATION_WORKERS)),
+        )
+        return results
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from .mission_gen_object import MissionType
 
 PROMPT_HEADER = """
@@ -56,22 +57,24 @@ PROMPT_FOOTER = """
 **Generate the Mission JSON now.**
 """
 
+# Full prompt template per mission type, assembled once at import
+_ASSEMBLED_PROMPTS = {
+    mission_type: f"{PROMPT_HEADER}\n\n{logic_module}\n\n{PROMPT_FOOTER}"
+    for mission_type, logic_module in (
+        (MissionType.LOCATE_AND_TRACK, LOGIC_LOCATE_AND_TRACK),
+        (MissionType.LOCATE_AND_LAND_SAFELY, LOGIC_LOCATE_AND_LAND_SAFELY),
+        (MissionType.LOCATE_AND_REPORT, LOGIC_LOCATE_AND_REPORT),
+    )
+}
+
+@lru_cache(maxsize=8)
 def build_meta_prompt(mission_type_str: str, n_waypoints: int) -> str:
     try:
         mission_type = MissionType(mission_type_str)
     except ValueError:
         raise ValueError(f"Unknown Mission Type: {mission_type_str}")
 
-    if mission_type == MissionType.LOCATE_AND_TRACK:
-        logic_module = LOGIC_LOCATE_AND_TRACK
-    elif mission_type == MissionType.LOCATE_AND_LAND_SAFELY:
-        logic_module = LOGIC_LOCATE_AND_LAND_SAFELY
-    elif mission_type == MissionType.LOCATE_AND_REPORT:
-        logic_module = LOGIC_LOCATE_AND_REPORT
-    else:
+    if mission_type not in _ASSEMBLED_PROMPTS:
         raise ValueError(f"Logic not implemented for: {mission_type}")
 
-    full_prompt = f"{PROMPT_HEADER}\n\n{logic_module}\n\n{PROMPT_FOOTER}"
-    final_prompt = full_prompt.replace("{{N}}", str(n_waypoints))
-    
-    return final_prompt
\ No newline at end of file
+    return _ASSEMBLED_PROMPTS[mission_type].replace("{{N}}", str(n_waypoints))
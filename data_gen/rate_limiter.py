@@ -0,0 +1,64 @@
+import asyncio
+import random
+import threading
+import time
+
+# Requests per minute allowed against the Gemini API, shared by every generator in the process.
+IMAGE_REQUESTS_PER_MINUTE = 10
+TEXT_REQUESTS_PER_MINUTE = 15
+
+# Backoff for sporadic 503s: exponential growth from RETRY_BASE_DELAY, capped at RETRY_MAX_DELAY
+RETRY_BASE_DELAY = 2.0
+RETRY_MAX_DELAY = 60.0
+
+
+class AsyncLimiter:
+    """
+    Token bucket allowing `max_rate` acquisitions per `time_period` seconds.
+    Usage: `async with LIMITER: ...` before each API call.
+
+    The bucket only relies on a thread lock and asyncio.sleep, so one instance can be
+    shared across event loops (e.g. the asyncio.run wrappers used by Streamlit).
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 60.0):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._tokens = float(max_rate)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _try_acquire(self) -> float:
+        """Takes a token if one is available and returns 0, otherwise returns the seconds until the next one."""
+        refill_rate = self.max_rate / self.time_period
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.max_rate, self._tokens + (now - self._last_refill) * refill_rate)
+            self._last_refill = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / refill_rate
+
+    async def acquire(self) -> None:
+        while (wait_time := self._try_acquire()) > 0:
+            await asyncio.sleep(wait_time)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+def retry_delay(attempt: int) -> float:
+    """
+    Seconds to wait before retrying after a failed attempt (0-based).
+    The jitter keeps concurrent workers from retrying in lockstep against the same overloaded window.
+    """
+    return min(RETRY_MAX_DELAY, random.uniform(1.0, RETRY_BASE_DELAY * 2 ** attempt))
+
+
+IMAGE_LIMITER = AsyncLimiter(max_rate=IMAGE_REQUESTS_PER_MINUTE, time_period=60)
+TEXT_LIMITER = AsyncLimiter(max_rate=TEXT_REQUESTS_PER_MINUTE, time_period=60)
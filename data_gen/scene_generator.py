@@ -1,23 +1,38 @@
-from google import genai
 from google.genai import types
 
-import time
+import asyncio
 from google.genai.errors import ServerError
 from .mission_gen_object import MissionType, Mission
 from .mission_prompt import build_meta_prompt
+from .rate_limiter import TEXT_LIMITER, retry_delay
+from .clients import get_genai_client
+
+# The response schema never changes, build it once instead of on every request
+_MISSION_SCHEMA = Mission.model_json_schema()
 
 class SceneGenerator:
     def __init__(self, api_key: str, model: str = "gemini-2.5-flash-lite"):
-        self.client = genai.Client(api_key=api_key)
+        self.api_key = api_key
         self.model = model
 
+    @property
+    def client(self):
+        """The client of the running event loop (see get_genai_client)."""
+        return get_genai_client(self.api_key)
+
     def generate_scene(self, mission_type_str: str, waypoints_per_mission: int) -> str:
+        """Synchronous wrapper around generate_scene_async for non-async callers."""
+        return asyncio.run(self.generate_scene_async(mission_type_str, waypoints_per_mission))
+
+    async def generate_scene_async(self, mission_type_str: str, waypoints_per_mission: int) -> str:
         prompt = build_meta_prompt(mission_type_str, waypoints_per_mission)
         
-        max_retries = 10
+        max_retries = 6
         for i in range(max_retries):
             try:
-                response = self.client.models.generate_content(
+                # Wait for quota before hitting the API instead of bouncing off rate limits
+                await TEXT_LIMITER.acquire()
+                response = await self.client.aio.models.generate_content(
                     model=self.model,
                     contents=[prompt],
                     config=types.GenerateContentConfig(
@@ -26,15 +41,15 @@ class SceneGenerator:
                             include_thoughts=False
                         ),
                         response_mime_type = "application/json",
-                        response_schema=Mission.model_json_schema()
+                        response_schema=_MISSION_SCHEMA
                     )
                 )
                 return response.text
             except ServerError as e:
                 if "503" in str(e) or "UNAVAILABLE" in str(e):
-                    wait_time = (i + 1) * 5
-                    print(f"SceneGenerator: Server overloaded (503). Retrying in {wait_time}s... (Attempt {i+1}/{max_retries})")
-                    time.sleep(wait_time)
+                    wait_time = retry_delay(i)
+                    print(f"SceneGenerator: Server overloaded (503). Retrying in {wait_time:.1f}s... (Attempt {i+1}/{max_retries})")
+                    await asyncio.sleep(wait_time)
                 else:
                     raise e
         
@@ -1,13 +1,18 @@
 from pydantic import BaseModel, Field
 from typing import List, Optional
 
-from google import genai
 from google.genai import types
 from google.genai.errors import ServerError
+from .rate_limiter import TEXT_LIMITER, retry_delay
+from .clients import get_genai_client
 
 from PIL import Image
+from functools import lru_cache
+import asyncio
+import hashlib
+import io
+import orjson
 import os
-import time
 
 class ValidationResult(BaseModel):
     mission_is_valid: bool = Field(..., description="The final verdict. True = Mission is solvable/correct. False = Mission is broken/impossible.")
@@ -15,20 +20,66 @@ class ValidationResult(BaseModel):
     needs_human_review: bool = Field(..., description="MUST be True if confidence_score is low (< 0.85) or if the image is ambiguous.")
     reasoning: str = Field(..., description="Explanation. E.g., 'Valid (High Confidence): House 42 is clearly legible.'")
 
+# Longest edge of images sent to the validator; larger images only cost upload bandwidth and tokens
+MAX_VALIDATION_IMAGE_EDGE = 1024
+
+
+def _load_validation_image(abs_path: str) -> Image.Image:
+    """Decodes and downscales an image for the validator."""
+    img = Image.open(abs_path)
+    # JPEG DCT scaling down to no less than twice the target edge (thumbnail's own reducing gap), then LANCZOS
+    img.draft("RGB", (MAX_VALIDATION_IMAGE_EDGE * 2, MAX_VALIDATION_IMAGE_EDGE * 2))
+    img.load()
+    img.thumbnail((MAX_VALIDATION_IMAGE_EDGE, MAX_VALIDATION_IMAGE_EDGE), Image.LANCZOS)
+    return img
+
+
+def _image_to_part(img: Image.Image) -> types.Part:
+    buf = io.BytesIO()
+    img.convert('RGB').save(buf, format='JPEG', quality=85)
+    return types.Part.from_bytes(data=buf.getvalue(), mime_type='image/jpeg')
+
+
+# Validation verdicts are persisted here (one JSON file per input hash) so pipeline re-runs skip the API
+VALIDATION_CACHE_DIR = "outputs/.validator_cache"
+
+
+@lru_cache(maxsize=1024)
+def _read_cached_validation(cache_key: str) -> dict:
+    """Raw verdict stored under `cache_key`; misses raise, so only hits stay in memory."""
+    with open(os.path.join(VALIDATION_CACHE_DIR, f"{cache_key}.json"), 'rb') as f:
+        return orjson.loads(f.read())
+
+
+@lru_cache(maxsize=512)
+def _encode_validation_image(abs_path: str, mtime_ns: int) -> types.Part:
+    """
+    Encodes the downscaled image to JPEG once so validation retries reuse the same bytes; mtime_ns is part
+    of the key so edited files are re-encoded. Only the encoded part is cached, not the decoded image.
+    """
+    with _load_validation_image(abs_path) as img:
+        return _image_to_part(img)
+
+
 class MissionValidator:
     def __init__(self, api_key: str, model: str = "gemini-2.5-flash-lite", confidence_threshold: float = 0.75):
-        self.client = genai.Client(api_key=api_key)
+        self.api_key = api_key
         self.model = model
         self.confidence_threshold = confidence_threshold
 
-    def load_image(self, relative_path: str, base_dir: str = ".") -> Image.Image:
-        path = os.path.join(base_dir, relative_path)
+    @property
+    def client(self):
+        """The client of the running event loop (see get_genai_client)."""
+        return get_genai_client(self.api_key)
+
+    def load_image_part(self, relative_path: str, base_dir: str = ".") -> types.Part:
+        """Returns the image as a pre-encoded JPEG part, ready to attach to the validation prompt."""
+        path = os.path.abspath(os.path.join(base_dir, relative_path))
         try:
-            return Image.open(path)
+            return _encode_validation_image(path, os.stat(path).st_mtime_ns)
         except Exception as e:
             print(f"Error loading image {path}: {e}")
-            # Return a placeholder black image to prevent crash, but validation will likely fail
-            return Image.new('RGB', (100, 100), color='black')
+            return _image_to_part(Image.new('RGB', (100, 100), color='black'))
 
     def build_validation_prompt(self, mission_entry: dict, image_base_dir: str):
         # Build the validation prompt
@@ -66,20 +117,97 @@ class MissionValidator:
             prompt_parts.append(f"Metadata: {entity_info}")
             
             for label, img_path in wp['media'].items():
-                img = self.load_image(img_path, image_base_dir)
+                img = self.load_image_part(img_path, image_base_dir)
                 prompt_parts.append(f"Image ({label}):")
                 prompt_parts.append(img)
 
         prompt_parts.append("\n**Final Decision:** Generate the ValidationResult JSON with the fields: mission_is_valid, confidence_score, needs_human_review, reasoning.")
         return prompt_parts
 
+    def precheck_mission(self, mission_entry: dict) -> Optional[ValidationResult]:
+        """
+        Cheap metadata check run before any API call. Returns a failing ValidationResult when the
+        mission is provably invalid (no unique target, or a distractor shares the target's house number).
+        """
+        waypoints = mission_entry['waypoints']
+        numbers = [wp.get('gt_entities', {}).get('house_number') for wp in waypoints]
+        targets = [n for wp, n in zip(waypoints, numbers) if wp['is_target']]
+        if len(targets) != 1:
+            reasoning = f"Mission must have exactly one target waypoint, found {len(targets)}."
+        elif numbers.count(targets[0]) > 1:
+            reasoning = f"Duplicate target house number in metadata: '{targets[0]}' also appears on a distractor."
+        else:
+            return None
+        return ValidationResult(
+            mission_is_valid=False,
+            confidence_score=1.0,
+            needs_human_review=False,
+            reasoning=f"[SYSTEM: Precheck] {reasoning}"
+        )
+
+    def validation_cache_key(self, mission_entry: dict, image_base_dir: str) -> str:
+        """
+        Hashes everything the verdict depends on: model, mission text, waypoint roles and image mtimes.
+        The mission id is left out, so a copy of a mission (e.g. re-imported under a new id) reuses the verdict.
+        """
+        waypoints = []
+        for wp in mission_entry['waypoints']:
+            media = []
+            for label, img_path in wp['media'].items():
+                path = os.path.join(image_base_dir, img_path)
+                media.append([label, img_path, os.stat(path).st_mtime_ns if os.path.exists(path) else None])
+            waypoints.append([wp['id'], wp['is_target'], wp.get('gt_entities', {}), media])
+        key_data = {
+            "model": self.model,
+            "type": mission_entry['type'],
+            "instruction": mission_entry.get('mission_instruction', mission_entry.get('instruction', 'N/A')),
+            "waypoints": waypoints,
+        }
+        return hashlib.blake2b(orjson.dumps(key_data, option=orjson.OPT_SORT_KEYS, default=str), digest_size=16).hexdigest()
+
+    def _load_cached_validation(self, cache_key: str) -> Optional[ValidationResult]:
+        try:
+            return ValidationResult.model_validate(_read_cached_validation(cache_key))
+        except (orjson.JSONDecodeError, IOError):
+            return None
+
+    def _store_cached_validation(self, cache_key: str, result: ValidationResult):
+        # The cache is only an optimization: a failed write must not cost the verdict
+        try:
+            os.makedirs(VALIDATION_CACHE_DIR, exist_ok=True)
+            with open(os.path.join(VALIDATION_CACHE_DIR, f"{cache_key}.json"), 'wb') as f:
+                f.write(orjson.dumps(result.model_dump()))
+        except OSError as e:
+            print(f"MissionValidator: Could not cache validation result: {e}")
+
     def validate_mission(self, mission_entry: dict, image_base_dir: str) -> ValidationResult:
-        max_retries = 10
+        """Synchronous wrapper around validate_mission_async for non-async callers."""
+        return asyncio.run(self.validate_mission_async(mission_entry, image_base_dir))
+
+    async def validate_mission_async(self, mission_entry: dict, image_base_dir: str) -> ValidationResult:
+        # Obvious failures are decided from metadata alone, without a multimodal API call
+        if (precheck := self.precheck_mission(mission_entry)) is not None:
+            return precheck
+
+        max_retries = 6
+        cache_key = None
+        contents = None
         for i in range(max_retries):
             try:
-                response = self.client.models.generate_content(
+                # Identical inputs (same mission, same image files) reuse the earlier verdict
+                if cache_key is None:
+                    cache_key = self.validation_cache_key(mission_entry, image_base_dir)
+                    if (cached := self._load_cached_validation(cache_key)) is not None:
+                        return cached
+                # Build the multimodal prompt once; 503 retries resend the same parts.
+                # Image decoding is synchronous PIL work, run it in a worker thread
+                if contents is None:
+                    contents = await asyncio.to_thread(self.build_validation_prompt, mission_entry, image_base_dir)
+                # Wait for quota before hitting the API instead of bouncing off rate limits
+                await TEXT_LIMITER.acquire()
+                response = await self.client.aio.models.generate_content(
                     model=self.model,
-                    contents=self.build_validation_prompt(mission_entry, image_base_dir),
+                    contents=contents,
                     config=types.GenerateContentConfig(
                         response_mime_type="application/json",
                         response_schema=ValidationResult,
@@ -96,13 +224,11 @@ class MissionValidator:
                     if not result.needs_human_review:
                         result.needs_human_review = True
                         result.reasoning += " [SYSTEM: Forced Review due to Low Confidence]"
-                
-                return result
             except ServerError as e:
                 if "503" in str(e) or "UNAVAILABLE" in str(e):
-                    wait_time = (i + 1) * 5
-                    print(f"MissionValidator: Server overloaded (503). Retrying in {wait_time}s... (Attempt {i+1}/{max_retries})")
-                    time.sleep(wait_time)
+                    wait_time = retry_delay(i)
+                    print(f"MissionValidator: Server overloaded (503). Retrying in {wait_time:.1f}s... (Attempt {i+1}/{max_retries})")
+                    await asyncio.sleep(wait_time)
                 else:
                     raise e
             except Exception as e:
@@ -112,6 +238,9 @@ class MissionValidator:
                     needs_human_review=True,
                     reasoning=f"Validator Error: {str(e)}"
                 )
+            else:
+                self._store_cached_validation(cache_key, result)
+                return result
         
         return ValidationResult(
             mission_is_valid=False,
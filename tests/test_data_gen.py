@@ -0,0 +1,95 @@
+import asyncio
+import time
+
+from data_gen.rate_limiter import AsyncLimiter, retry_delay, RETRY_BASE_DELAY, RETRY_MAX_DELAY
+from data_gen import validator as validator_module
+from data_gen.validator import MissionValidator, ValidationResult
+
+
+def test_limiter_allows_burst_then_waits():
+    limiter = AsyncLimiter(max_rate=3, time_period=60)
+    assert [limiter._try_acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    wait_time = limiter._try_acquire()
+    assert 0 < wait_time <= 60 / 3
+
+
+def test_limiter_acquire_sleeps_for_refill():
+    limiter = AsyncLimiter(max_rate=2, time_period=0.2)
+
+    async def acquire_all():
+        for _ in range(4):
+            async with limiter:
+                pass
+
+    start = time.monotonic()
+    asyncio.run(acquire_all())
+    # Two tokens up front, the other two refill at 0.1s each
+    assert time.monotonic() - start >= 0.15
+
+
+def test_retry_delay_bounds():
+    for attempt in range(5):
+        for _ in range(20):
+            assert 1.0 <= retry_delay(attempt) <= RETRY_BASE_DELAY * 2 ** attempt
+    assert all(retry_delay(20) <= RETRY_MAX_DELAY for _ in range(20))
+
+
+def _mission(*waypoints):
+    return {
+        "type": "locate_and_report",
+        "waypoints": [
+            {"id": f"wp{i}", "is_target": is_target, "gt_entities": {"house_number": number}, "media": {}}
+            for i, (is_target, number) in enumerate(waypoints)
+        ]
+    }
+
+
+def test_precheck_passes_valid_mission():
+    validator = MissionValidator(api_key="test")
+    assert validator.precheck_mission(_mission((True, "12"), (False, "14"), (False, "16"))) is None
+
+
+def test_precheck_rejects_target_count():
+    validator = MissionValidator(api_key="test")
+    for mission in [_mission((False, "12"), (False, "14")), _mission((True, "12"), (True, "14"))]:
+        result = validator.precheck_mission(mission)
+        assert result is not None
+        assert result.mission_is_valid is False
+        assert result.reasoning.startswith("[SYSTEM: Precheck]")
+        assert "exactly one target" in result.reasoning
+
+
+def test_precheck_rejects_duplicate_house_number():
+    validator = MissionValidator(api_key="test")
+    result = validator.precheck_mission(_mission((True, "12"), (False, "12")))
+    assert result is not None
+    assert result.mission_is_valid is False
+    assert "Duplicate target house number" in result.reasoning
+
+
+def test_validation_cache_key_ignores_mission_id(tmp_path):
+    validator = MissionValidator(api_key="test")
+    mission = _mission((True, "12"), (False, "14"))
+    copy = dict(mission, id="mission_other")
+    assert validator.validation_cache_key(mission, str(tmp_path)) == validator.validation_cache_key(copy, str(tmp_path))
+
+
+def test_validation_cache_roundtrip(tmp_path, monkeypatch):
+    monkeypatch.setattr(validator_module, "VALIDATION_CACHE_DIR", str(tmp_path / "cache"))
+    validator = MissionValidator(api_key="test")
+    result = ValidationResult(mission_is_valid=True, confidence_score=0.9, needs_human_review=False, reasoning="ok")
+
+    assert validator._load_cached_validation("key_roundtrip") is None
+    validator._store_cached_validation("key_roundtrip", result)
+    assert validator._load_cached_validation("key_roundtrip") == result
+
+
+def test_validation_cache_write_failure_is_not_raised(tmp_path, monkeypatch):
+    # A file where the cache directory should be makes every write fail
+    (tmp_path / "cache").write_text("")
+    monkeypatch.setattr(validator_module, "VALIDATION_CACHE_DIR", str(tmp_path / "cache"))
+    validator = MissionValidator(api_key="test")
+    result = ValidationResult(mission_is_valid=True, confidence_score=0.9, needs_human_review=False, reasoning="ok")
+
+    validator._store_cached_validation("key_unwritable", result)
+    assert validator._load_cached_validation("key_unwritable") is None
@@ -19,6 +19,26 @@ from utils.hf_utils import (
 from utils.data_utils import get_project_path, prepare_missions_for_export
 
 
+# Minimal valid 1x1 PNG: signature + IHDR chunk + IDAT chunk + IEND chunk
+_PNG_1x1 = bytes([
+    0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A,  # PNG signature
+    0x00, 0x00, 0x00, 0x0D,  # IHDR length
+    0x49, 0x48, 0x44, 0x52,  # IHDR type
+    0x00, 0x00, 0x00, 0x01,  # width: 1
+    0x00, 0x00, 0x00, 0x01,  # height: 1
+    0x08, 0x02,              # bit depth: 8, color type: 2 (RGB)
+    0x00, 0x00, 0x00,        # compression, filter, interlace
+    0x90, 0x77, 0x53, 0xDE,  # CRC
+    0x00, 0x00, 0x00, 0x0C,  # IDAT length
+    0x49, 0x44, 0x41, 0x54,  # IDAT type
+    0x08, 0xD7, 0x63, 0xF8, 0xFF, 0xFF, 0xFF, 0x00,  # compressed data
+    0x05, 0xFE, 0x02, 0xFE,  # CRC (approximate)
+    0x00, 0x00, 0x00, 0x00,  # IEND length
+    0x49, 0x45, 0x4E, 0x44,  # IEND type
+    0xAE, 0x42, 0x60, 0x82,  # CRC
+])
+
+
 # Test fixtures
 @pytest.fixture
 def sample_project_with_images(tmp_path):
@@ -27,30 +47,10 @@ def sample_project_with_images(tmp_path):
     images_path = project_path / "images"
     images_path.mkdir(parents=True)
     
-    # Create test images (simple 1x1 pixel PNGs)
+    # Create test images (simple 1x1 pixel PNGs), three separate files
     test_images = []
-    for i, name in enumerate(["forward.png", "ground.png", "secondary.png"]):
-        img_path = images_path / name
-        # Create a minimal valid PNG file
-        # PNG header + IHDR chunk + IDAT chunk + IEND chunk
-        png_data = bytes([
-            0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A,  # PNG signature
-            0x00, 0x00, 0x00, 0x0D,  # IHDR length
-            0x49, 0x48, 0x44, 0x52,  # IHDR type
-            0x00, 0x00, 0x00, 0x01,  # width: 1
-            0x00, 0x00, 0x00, 0x01,  # height: 1
-            0x08, 0x02,              # bit depth: 8, color type: 2 (RGB)
-            0x00, 0x00, 0x00,        # compression, filter, interlace
-            0x90, 0x77, 0x53, 0xDE,  # CRC
-            0x00, 0x00, 0x00, 0x0C,  # IDAT length
-            0x49, 0x44, 0x41, 0x54,  # IDAT type
-            0x08, 0xD7, 0x63, 0xF8, 0xFF, 0xFF, 0xFF, 0x00,  # compressed data
-            0x05, 0xFE, 0x02, 0xFE,  # CRC (approximate)
-            0x00, 0x00, 0x00, 0x00,  # IEND length
-            0x49, 0x45, 0x4E, 0x44,  # IEND type
-            0xAE, 0x42, 0x60, 0x82,  # CRC
-        ])
-        img_path.write_bytes(png_data)
+    for name in ["forward.png", "ground.png", "secondary.png"]:
+        (images_path / name).write_bytes(_PNG_1x1)
         test_images.append(f"images/{name}")
     
     return project_path, test_images
@@ -195,6 +195,26 @@ class TestExportWithImages:
                 for media_path in wp["media"]:
                     assert media_path.startswith("images/"), f"Path should be relative: {media_path}"
     
+    def test_export_is_a_snapshot(self, sample_mission_with_images, tmp_path):
+        """Test that overwriting a project image in place leaves exported copies untouched."""
+        mission, project_path = sample_mission_with_images
+        output_dir = tmp_path / "exports"
+        output_dir.mkdir()
+
+        dataset_path = export_missions_to_hf_dataset(
+            missions=[mission],
+            project_path=str(project_path),
+            output_dir=str(output_dir),
+            dataset_name="test_dataset"
+        )
+
+        # Same write pattern as the mission editor's upload
+        with open(project_path / "images" / "forward.png", "wb") as f:
+            f.write(b"replaced")
+
+        for copied in (Path(dataset_path) / "images").glob("*.png"):
+            assert copied.read_bytes() == _PNG_1x1
+
     def test_export_creates_valid_structure(self, sample_mission_with_images, tmp_path):
         """Test that exported dataset has valid structure."""
         mission, project_path = sample_mission_with_images
@@ -416,5 +436,45 @@ class TestEdgeCases:
         assert len(list(images_dir.glob("*"))) > 0
 
 
+class TestImageDedupe:
+    """Test that each source file is exported once, however many names point at it."""
+
+    def _export(self, mission, project_path, tmp_path):
+        dataset_path = export_missions_to_hf_dataset(
+            missions=[mission],
+            project_path=str(project_path),
+            output_dir=str(tmp_path / "exports"),
+            dataset_name="test_dataset"
+        )
+        with open(Path(dataset_path) / "data" / "sft_train.json") as f:
+            exported = json.load(f)[0]
+        return Path(dataset_path), exported
+
+    def test_distinct_images_are_exported_separately(self, sample_mission_with_images, tmp_path):
+        mission, project_path = sample_mission_with_images
+        dataset_path, exported = self._export(mission, project_path, tmp_path)
+
+        # forward.png is referenced by both waypoints but copied once
+        assert len(list((dataset_path / "images").glob("*.png"))) == 3
+        wp1, wp2 = exported["waypoints"]
+        assert wp1["media"][0] == wp2["media"][0]
+        assert len({*wp1["media"], *wp2["media"]}) == 3
+
+    def test_hard_linked_images_are_exported_once(self, sample_mission_with_images, tmp_path):
+        mission, project_path = sample_mission_with_images
+        images_path = project_path / "images"
+        # Replace ground/secondary with hard links to forward.png
+        for name in ["ground.png", "secondary.png"]:
+            (images_path / name).unlink()
+            os.link(images_path / "forward.png", images_path / name)
+
+        dataset_path, exported = self._export(mission, project_path, tmp_path)
+
+        assert len(list((dataset_path / "images").glob("*.png"))) == 1
+        media = {path for wp in exported["waypoints"] for path in wp["media"]}
+        assert len(media) == 1
+        assert (dataset_path / media.pop()).exists()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,143 @@
+import json
+import os
+
+import orjson
+import pytest
+
+from utils import data_utils, mission_types_manager
+from utils.data_utils import (
+    _write_json,
+    start_generation_log,
+    append_generation_log,
+    load_generation_log,
+    latest_generation_run,
+    mark_generation_run_imported,
+)
+
+
+def _tmp_files(directory):
+    return [name for name in os.listdir(directory) if name.startswith(".tmp_")]
+
+
+def test_write_json_roundtrip(tmp_path):
+    path = tmp_path / "metadata.json"
+    _write_json(str(path), {"missions": [{"id": "m1"}]})
+    _write_json(str(path), {"missions": [{"id": "m2"}]})
+
+    assert json.loads(path.read_text()) == {"missions": [{"id": "m2"}]}
+    assert _tmp_files(tmp_path) == []
+
+
+def test_write_json_failed_replace_keeps_original(tmp_path, monkeypatch):
+    path = tmp_path / "metadata.json"
+    _write_json(str(path), {"missions": []})
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+    monkeypatch.setattr(os, "replace", failing_replace)
+
+    with pytest.raises(OSError):
+        _write_json(str(path), {"missions": [{"id": "lost"}]})
+    assert json.loads(path.read_text()) == {"missions": []}
+    assert _tmp_files(tmp_path) == []
+
+
+@pytest.fixture
+def runs_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_utils, "GENERATION_RUNS_DIR", str(tmp_path / "generation_runs"))
+    return tmp_path / "generation_runs"
+
+
+def test_generation_log_roundtrip(runs_dir):
+    run_id = start_generation_log("project_a", 3, 100.0)
+    append_generation_log(run_id, {"name": "mission_1", "status": "error"})
+    append_generation_log(run_id, {"name": "mission_2", "status": "success"})
+    # A retry logs the mission again under the same name
+    append_generation_log(run_id, {"name": "mission_1", "status": "success"})
+
+    header, entries = load_generation_log(run_id)
+    assert header == {"project": "project_a", "total": 3, "start_time": 100.0}
+    assert {e["name"]: e["status"] for e in entries} == {"mission_1": "success", "mission_2": "success"}
+
+
+def test_generation_log_ignores_torn_line(runs_dir):
+    run_id = start_generation_log("project_a", 2, 100.0)
+    append_generation_log(run_id, {"name": "mission_1", "status": "success"})
+    with open(data_utils.generation_log_path(run_id), "ab") as f:
+        f.write(orjson.dumps({"name": "mission_2", "status": "success"})[:10])
+
+    _, entries = load_generation_log(run_id)
+    assert [e["name"] for e in entries] == ["mission_1"]
+
+
+def test_generation_log_missing_run(runs_dir):
+    assert load_generation_log("run_missing") is None
+    assert latest_generation_run("project_a") is None
+
+
+def test_latest_generation_run_per_project(runs_dir):
+    start_generation_log("project_a", 1, 100.0)
+    new_a = start_generation_log("project_a", 1, 200.0)
+    only_b = start_generation_log("project_b", 1, 150.0)
+
+    assert latest_generation_run("project_a") == new_a
+    assert latest_generation_run("project_b") == only_b
+
+    # An imported run is not offered again, and the run it superseded is not offered either
+    mark_generation_run_imported(new_a)
+    assert latest_generation_run("project_a") is None
+    assert latest_generation_run("project_b") == only_b
+    # The log itself is kept
+    assert load_generation_log(new_a) is not None
+
+
+def test_importing_superseded_run_keeps_latest(runs_dir):
+    old_a = start_generation_log("project_a", 1, 100.0)
+    new_a = start_generation_log("project_a", 1, 200.0)
+
+    mark_generation_run_imported(old_a)
+    assert latest_generation_run("project_a") == new_a
+
+
+@pytest.fixture
+def mission_types_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(mission_types_manager, "MISSION_TYPES_DIR", str(tmp_path / "mission_types"))
+    monkeypatch.setattr(mission_types_manager, "_cache", (None, None))
+    monkeypatch.setattr(mission_types_manager, "_parsed_files", {})
+    (tmp_path / "mission_types").mkdir()
+    return tmp_path / "mission_types"
+
+
+def test_save_mission_type_invalidates_cache(mission_types_dir):
+    mission_types_manager.save_mission_type("patrol", {"description": "one", "default_state": {}})
+    assert mission_types_manager.get_mission_type("patrol")["description"] == "one"
+
+    mission_types_manager.save_mission_type("patrol", {"description": "updated", "default_state": {}})
+    assert mission_types_manager.get_mission_type("patrol")["description"] == "updated"
+
+    mission_types_manager.save_mission_type("survey", {"description": "three", "default_state": {}})
+    assert sorted(mission_types_manager.get_mission_type_names()) == ["patrol", "survey"]
+
+
+def test_save_mission_type_keeps_yaml_format(mission_types_dir):
+    config = {"description": "yaml", "default_state": {}, "ui_metadata": {"x": 1}}
+    mission_types_manager.save_mission_type("patrol", config, prefer_yaml=True)
+    mission_types_manager.save_mission_type("patrol", {"description": "still yaml", "default_state": {}})
+
+    assert sorted(os.listdir(mission_types_dir)) == ["patrol.yaml"]
+    assert mission_types_manager.get_mission_type("patrol") == {"description": "still yaml", "default_state": {}}
+
+
+def test_get_mission_type_returns_copy(mission_types_dir):
+    mission_types_manager.save_mission_type("patrol", {"description": "one", "default_state": {"a": 1}})
+    mission_types_manager.get_mission_type("patrol")["default_state"]["a"] = 2
+    assert mission_types_manager.get_mission_type("patrol")["default_state"] == {"a": 1}
+
+
+def test_same_size_rewrite_is_reparsed(mission_types_dir):
+    mission_types_manager.save_mission_type("patrol", {"description": "one", "default_state": {}})
+    assert mission_types_manager.get_mission_type("patrol")["description"] == "one"
+
+    # Same size rewrite, usually within the filesystem's mtime granularity
+    mission_types_manager.save_mission_type("patrol", {"description": "two", "default_state": {}})
+    assert mission_types_manager.get_mission_type("patrol")["description"] == "two"
@@ -0,0 +1,40 @@
+import io
+import os
+import shutil
+
+from PIL import Image
+
+from utils.ui_utils import bake_thumbnail, load_thumbnail, THUMBS_DIRNAME
+
+
+def test_replaced_image_does_not_reuse_baked_thumbnail(tmp_path):
+    image_path = tmp_path / "forward.png"
+    Image.new("RGB", (800, 600), "red").save(image_path)
+    bake_thumbnail(str(image_path), 360)
+    assert load_thumbnail(str(image_path), 360)[1:] == (360, 270)
+
+    # Replaced by a copy that keeps its (older) source mtime, as copy2 does
+    replacement = tmp_path / "replacement.png"
+    Image.new("RGB", (400, 400), "blue").save(replacement)
+    os.utime(replacement, (1, 1))
+    shutil.copy2(replacement, image_path)
+
+    data, width, height = load_thumbnail(str(image_path), 360)
+    assert (width, height) == (360, 360)
+    with Image.open(io.BytesIO(data)) as img:
+        red, green, blue = img.getpixel((0, 0))
+    assert blue > 200 and red < 50
+
+
+def test_bake_thumbnail_drops_outdated_bakes(tmp_path):
+    image_path = tmp_path / "forward.png"
+    Image.new("RGB", (800, 600), "red").save(image_path)
+    bake_thumbnail(str(image_path), 360)
+    bake_thumbnail(str(image_path), 128)
+
+    Image.new("RGB", (640, 480), "blue").save(image_path)
+    bake_thumbnail(str(image_path), 360)
+
+    baked = sorted(os.listdir(tmp_path / THUMBS_DIRNAME / "forward.png"))
+    assert len(baked) == 2
+    assert baked[0].startswith("128.") and baked[1].startswith("360.")
@@ -1,19 +1,30 @@
-import json
 import os
+import orjson
+from functools import lru_cache
 from typing import Dict, Any
 
 CONFIG_FILE = "configs/app_config.json"
 
-def load_config() -> Dict[str, str]:
-    if not os.path.exists(CONFIG_FILE):
-        return {"hf_token": "", "gemini_api_key": ""}
+@lru_cache(maxsize=4)
+def _load_parsed(path: str, mtime_ns: int, size: int) -> Dict[str, str]:
+    """Parses the config once per (mtime, size); a rewrite changes the key."""
     try:
-        with open(CONFIG_FILE, 'r') as f:
-            return json.load(f)
-    except json.JSONDecodeError:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    except orjson.JSONDecodeError:
          return {"hf_token": "", "gemini_api_key": ""}
 
+def load_config() -> Dict[str, str]:
+    try:
+        st = os.stat(CONFIG_FILE)
+    except FileNotFoundError:
+        return {"hf_token": "", "gemini_api_key": ""}
+    # Flat dict of strings, so a shallow copy keeps the cached entry safe from callers
+    return dict(_load_parsed(CONFIG_FILE, st.st_mtime_ns, st.st_size))
+
 def save_config(hf_token: str, gemini_api_key: str):
     config = {"hf_token": hf_token, "gemini_api_key": gemini_api_key}
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=4)
+    with open(CONFIG_FILE, 'wb') as f:
+        f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+    # Same-size rewrites within the filesystem's mtime granularity would otherwise hit the old entry
+    _load_parsed.cache_clear()
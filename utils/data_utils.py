@@ -1,15 +1,47 @@
-import json
+import mmap
 import os
+import orjson
 import shutil
+import uuid
 from typing import List, Dict, Any, Optional
 
 PROJECTS_DIR = "projects"
+# Above this size metadata is parsed straight from a read-only mapping instead of a bytes copy
+MMAP_THRESHOLD = 1 << 20
+
+def _read_json(path: str) -> Any:
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+        return orjson.loads(f.read())
+
+def _write_json(path: str, data: Any):
+    """
+    Writes to a temp file next to `path` and swaps it in with os.replace,
+    so a crash mid-save never leaves a truncated metadata file behind.
+    """
+    # orjson only offers 2-space indentation; the files stay human-readable
+    payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    tmp_path = os.path.join(os.path.dirname(path), f".tmp_{uuid.uuid4().hex}.json")
+    # Created like open() would (0666 minus the umask), unlike mkstemp's 0600
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
 
 def list_projects() -> List[str]:
     """Returns a list of project names."""
-    if not os.path.exists(PROJECTS_DIR):
+    # scandir's DirEntry answers is_dir() from the directory listing, without a stat per entry
+    try:
+        with os.scandir(PROJECTS_DIR) as entries:
+            return [e.name for e in entries if e.is_dir()]
+    except FileNotFoundError:
         return []
-    return [d for d in os.listdir(PROJECTS_DIR) if os.path.isdir(os.path.join(PROJECTS_DIR, d))]
 
 def create_project(project_name: str) -> bool:
     """Creates a new project directory structure. Returns True if successful, False if already exists."""
@@ -25,8 +57,7 @@ def create_project(project_name: str) -> bool:
         "missions": []
     }
     
-    with open(metadata_path, 'w') as f:
-        json.dump(initial_data, f, indent=4)
+    _write_json(metadata_path, initial_data)
         
     return True
 
@@ -40,8 +71,7 @@ def load_project_data(project_name: str) -> Dict[str, Any]:
     if not os.path.exists(metadata_path):
         return {"missions": []}
         
-    with open(metadata_path, 'r') as f:
-        data = json.load(f)
+    data = _read_json(metadata_path)
         
     # Migration: If it's the old format with top-level "waypoints", move them to a default mission
     if "waypoints" in data and "missions" not in data:
@@ -65,22 +95,96 @@ def save_project_data(project_name: str, data: Dict[str, Any]):
     # Ensure directory exists (just in case)
     os.makedirs(os.path.dirname(metadata_path), exist_ok=True)
     
-    with open(metadata_path, 'w') as f:
-        json.dump(data, f, indent=4)
+    _write_json(metadata_path, data)
 
 # Legacy Global Dataset Functions (Deprecated but kept for safety if needed)
 def load_dataset(metadata_path: str) -> List[Dict[str, Any]]:
     # Legacy support
     if not os.path.exists(metadata_path):
         return []
-    with open(metadata_path, 'r') as f:
-        return json.load(f)
+    return _read_json(metadata_path)
 
 def save_dataset(metadata_path: str, data: List[Dict[str, Any]]):
     # Legacy support
     os.makedirs(os.path.dirname(metadata_path), exist_ok=True)
-    with open(metadata_path, 'w') as f:
-        json.dump(data, f, indent=4)
+    _write_json(metadata_path, data)
+
+# Every generation run appends its finished missions to its own log (outputs/generation_runs/<run_id>/log.jsonl),
+# so a reload or restart does not lose paid-for results
+GENERATION_RUNS_DIR = os.path.join("outputs", "generation_runs")
+# Created next to a run's log once its missions are imported; such runs are not offered for restore again
+_IMPORTED_MARKER = "imported"
+
+def generation_log_path(run_id: str) -> str:
+    return os.path.join(GENERATION_RUNS_DIR, run_id, "log.jsonl")
+
+def _latest_run_pointer(project: str) -> str:
+    # Names the project's newest run, so restore checks one small file instead of every run's header
+    return os.path.join(GENERATION_RUNS_DIR, "latest", f"{project}.json")
+
+def start_generation_log(project: str, total: int, start_time: float) -> str:
+    """
+    Starts the log of a new generation run for `project` and returns the run id.
+    The header line records the project, run size and start time; the run becomes the project's latest.
+    """
+    run_id = f"run_{uuid.uuid4().hex[:12]}"
+    os.makedirs(os.path.join(GENERATION_RUNS_DIR, run_id))
+    with open(generation_log_path(run_id), 'wb') as f:
+        f.write(orjson.dumps({"project": project, "total": total, "start_time": start_time}) + b"\n")
+    os.makedirs(os.path.dirname(_latest_run_pointer(project)), exist_ok=True)
+    _write_json(_latest_run_pointer(project), run_id)
+    return run_id
+
+def append_generation_log(run_id: str, entry: Dict[str, Any]):
+    with open(generation_log_path(run_id), 'ab') as f:
+        f.write(orjson.dumps(entry, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) + b"\n")
+
+def load_generation_log(run_id: str) -> Optional[tuple]:
+    """
+    (header, entries) of a generation run, None if it has no log.
+    A retried mission is logged again under the same name; the later entry wins.
+    """
+    try:
+        with open(generation_log_path(run_id), 'rb') as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return None
+    if not lines:
+        return None
+    header = orjson.loads(lines[0])
+    entries = {}
+    for line in lines[1:]:
+        try:
+            entry = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            # Torn last line from a crash mid-append
+            break
+        entries[entry['name']] = entry
+    return header, list(entries.values())
+
+def latest_generation_run(project: str) -> Optional[str]:
+    """Id of the most recently started run of `project`, None if there is none or it was imported already."""
+    try:
+        run_id = _read_json(_latest_run_pointer(project))
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    if os.path.exists(os.path.join(GENERATION_RUNS_DIR, run_id, _IMPORTED_MARKER)) or not os.path.exists(generation_log_path(run_id)):
+        return None
+    return run_id
+
+def mark_generation_run_imported(run_id: str):
+    """Keeps the log for reference but stops the run from being restored and imported a second time."""
+    open(os.path.join(GENERATION_RUNS_DIR, run_id, _IMPORTED_MARKER), 'wb').close()
+    with open(generation_log_path(run_id), 'rb') as f:
+        pointer = _latest_run_pointer(orjson.loads(f.readline())['project'])
+    try:
+        # Leave the pointer alone if a newer run of the project already took it over
+        if _read_json(pointer) == run_id:
+            os.remove(pointer)
+    except (OSError, orjson.JSONDecodeError):
+        pass
+
+_REQUIRED_WP_KEYS = frozenset(("id", "gt_entities", "is_target", "media"))
 
 def validate_data_structure(data: Any) -> bool:
     # Adjusted validation for { missions: [...] }
@@ -91,7 +195,7 @@ def validate_data_structure(data: Any) -> bool:
         for m in data["missions"]:
             if "waypoints" not in m: return False
             for wp in m["waypoints"]:
-                 if not all(k in wp for k in ("id", "gt_entities", "is_target", "media")):
+                 if not _REQUIRED_WP_KEYS <= wp.keys():
                      return False
         return True
     
@@ -114,18 +218,17 @@ def filter_missions(
     """
     Filter missions based on type, split, and source criteria.
     """
-    filtered = missions
+    # Frozensets make each membership test O(1); one pass instead of one list per filter
+    types = frozenset(selected_types) if selected_types is not None else None
+    splits = frozenset(selected_splits) if selected_splits is not None else None
+    sources = frozenset(selected_sources) if selected_sources is not None else None
     
-    if selected_types is not None:
-        filtered = [m for m in filtered if m.get('type', 'locate_and_report') in selected_types]
-    
-    if selected_splits is not None:
-        filtered = [m for m in filtered if m.get('dataset_split', 'sft_train') in selected_splits]
-    
-    if selected_sources is not None:
-        filtered = [m for m in filtered if m.get('creation_source', 'manual') in selected_sources]
-    
-    return filtered
+    return [
+        m for m in missions
+        if (types is None or m.get('type', 'locate_and_report') in types)
+        and (splits is None or m.get('dataset_split', 'sft_train') in splits)
+        and (sources is None or m.get('creation_source', 'manual') in sources)
+    ]
 
 
 def prepare_missions_for_export(
@@ -135,22 +238,22 @@ def prepare_missions_for_export(
     """
     Prepare missions for export by ensuring all required fields are present.
     """
-    project_path = get_project_path(project_name)
     prepared = []
     
-    for m in missions:
+    for i, m in enumerate(missions, 1):
+        # Fallbacks are only built when the key is actually missing
+        instruction = m["mission_instruction"] if "mission_instruction" in m else m.get("instruction", "")
         # Ensure all required fields
-        prepared_mission = {
-            "id": m.get("id", f"mission_{len(prepared)+1}"),
+        prepared.append({
+            "id": m["id"] if "id" in m else f"mission_{i}",
             "name": m.get("name", "Untitled Mission"),
             "type": m.get("type", "locate_and_report"),
             "dataset_split": m.get("dataset_split", "sft_train"),
             "creation_source": m.get("creation_source", "manual"),
-            "instruction": m.get("mission_instruction", m.get("instruction", "")),
-            "mission_instruction": m.get("mission_instruction", m.get("instruction", "")),
+            "instruction": instruction,
+            "mission_instruction": instruction,
             "state_config": m.get("state_config", {}),
             "waypoints": m.get("waypoints", [])
-        }
-        prepared.append(prepared_mission)
+        })
     
     return prepared
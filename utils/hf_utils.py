@@ -1,14 +1,176 @@
+import mmap
 import os
-import json
+import orjson
 import shutil
 import tempfile
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from huggingface_hub import HfApi, hf_hub_download, snapshot_download, create_repo, upload_folder
 from typing import Optional, List, Dict, Any, Tuple
 
 # Required fields for a valid mission entry in HuggingFace format
 REQUIRED_MISSION_FIELDS = ["instruction", "waypoints", "state_config"]
 REQUIRED_WAYPOINT_FIELDS = ["id", "gt_entities", "is_target", "media"]
+_REQUIRED_MISSION_KEYS = frozenset(REQUIRED_MISSION_FIELDS)
+_REQUIRED_WAYPOINT_KEYS = frozenset(REQUIRED_WAYPOINT_FIELDS)
+
+# Split files above this size are memory-mapped for parsing
+SPLIT_MMAP_THRESHOLD = 10 << 20
+
+# Image copies are I/O bound; threads overlap the syscalls (they release the GIL)
+COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+# Dataset card written next to the exported splits; filled in with str.format
+_README_TEMPLATE = """---
+license: mit
+task_categories:
+  - visual-question-answering
+  - robotics
+language:
+  - en
+tags:
+  - uav
+  - mission
+  - multimodal
+  - vlm
+---
+
+# {dataset_name}
+
+UAV Mission Dataset for training and evaluating vision-language models on UAV navigation tasks.
+
+## Dataset Description
+
+This dataset contains **{total_missions}** missions designed for UAV visual navigation and decision-making.
+
+### Splits
+
+| Split | Count |
+|-------|-------|
+| sft_train | {sft_train} |
+| rl_train | {rl_train} |
+| validation | {validation} |
+
+## Usage with uav_mission_env
+
+Each entry can be directly used to initialize a `MissionEnvironment`:
+
+```python
+from uav_mission_env import MissionEnvironment
+import json
+
+# Load a single entry
+with open("data/sft_train.json") as f:
+    missions = json.load(f)
+
+# Initialize environment with a specific mission
+config = {{"mission_config": missions[0]}}
+env = MissionEnvironment(config=config)
+
+# Run the mission
+obs = env.reset()
+action = {{"tool_name": "next_goal", "parameters": {{"next_goal": "waypoint_1"}}}}
+obs, reward, terminated, truncated, info = env.step(action)
+```
+
+## Data Format
+
+Each mission entry contains:
+- `instruction`: The mission goal/instruction
+- `waypoints`: List of waypoint dictionaries with:
+  - `id`: Unique identifier
+  - `gt_entities`: Ground truth entities at this location
+  - `is_target`: Whether this is the target location
+  - `media`: List of image paths
+- `state_config`: State machine configuration for the mission
+- `type`: Mission type (e.g., locate_and_report)
+- `dataset_split`: Train/validation split
+
+## License
+
+MIT License
+"""
+
+
+def _write_json_array(path: str, entries: List[Dict[str, Any]]):
+    """
+    Writes entries as a JSON array, encoding one mission per line so the
+    whole split is never held as a single serialized string.
+    The array goes to a temp file first, so an interrupted export never leaves a truncated split behind.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb", buffering=1 << 20) as f:
+        f.write(b"[\n")
+        for i, entry in enumerate(entries):
+            if i:
+                f.write(b",\n")
+            f.write(orjson.dumps(entry, option=orjson.OPT_NON_STR_KEYS))
+        f.write(b"\n]\n")
+    os.replace(tmp_path, path)
+
+
+def _read_json_file(path: str) -> Any:
+    with open(path, "rb") as f:
+        # Large splits are parsed straight from the page cache instead of a bytes copy
+        if os.fstat(f.fileno()).st_size > SPLIT_MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+        return orjson.loads(f.read())
+
+
+def _copy_file_range(src: str, dst: str):
+    """In-kernel copy; btrfs/xfs turn this into a copy-on-write reflink."""
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        remaining = os.fstat(fsrc.fileno()).st_size
+        while remaining > 0:
+            copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+            if copied == 0:
+                break
+            remaining -= copied
+    shutil.copystat(src, dst)
+
+
+def _copy_data(src: str, dst: str):
+    if hasattr(os, "copy_file_range"):
+        try:
+            _copy_file_range(src, dst)
+            return
+        except OSError:
+            # EXDEV/ENOSYS/EINVAL on older kernels or some filesystems
+            pass
+    shutil.copy2(src, dst)
+
+
+def _fast_copy(src: str, dst: str):
+    """
+    Copies src to dst as a reflink/in-kernel copy (copy_file_range), falling back to shutil.copy2.
+    Never hard-links: the editor overwrites images in place, which would rewrite every linked copy.
+    """
+    if os.path.lexists(dst):
+        # Media that already points at its destination (e.g. an absolute path into the project)
+        if os.path.realpath(src) == os.path.realpath(dst):
+            return
+        # Older exports may hold hard links into a project; never write through them
+        os.unlink(dst)
+    _copy_data(src, dst)
+
+
+def _file_identity(path: str) -> Optional[Tuple[int, int]]:
+    """(device, inode) of an existing file, None if it is missing."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_dev, st.st_ino
+
+
+def copy_files(copy_jobs: List[Tuple[str, str]]):
+    """Runs (src, dst) copies on a thread pool; any copy error is re-raised."""
+    if not copy_jobs:
+        return
+    with ThreadPoolExecutor(max_workers=min(COPY_WORKERS, len(copy_jobs))) as executor:
+        list(executor.map(lambda job: _fast_copy(*job), copy_jobs))
 
 
 def validate_hf_mission_format(mission: Dict[str, Any]) -> Tuple[bool, str]:
@@ -19,13 +181,13 @@ def validate_hf_mission_format(mission: Dict[str, Any]) -> Tuple[bool, str]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    # Check required mission fields
-    for field in REQUIRED_MISSION_FIELDS:
-        if field not in mission:
-            return False, f"Missing required field: {field}"
+    # Check required mission fields; the ordered scan only runs to name the missing one
+    if not isinstance(mission, dict) or not _REQUIRED_MISSION_KEYS <= mission.keys():
+        field = next(f for f in REQUIRED_MISSION_FIELDS if f not in mission)
+        return False, f"Missing required field: {field}"
     
     # Validate waypoints
-    waypoints = mission.get("waypoints", [])
+    waypoints = mission["waypoints"]
     if not isinstance(waypoints, list):
         return False, "waypoints must be a list"
     
@@ -33,18 +195,17 @@ def validate_hf_mission_format(mission: Dict[str, Any]) -> Tuple[bool, str]:
         return False, "waypoints list cannot be empty"
     
     for i, wp in enumerate(waypoints):
-        for field in REQUIRED_WAYPOINT_FIELDS:
-            if field not in wp:
-                return False, f"Waypoint {i} missing required field: {field}"
+        if not isinstance(wp, dict) or not _REQUIRED_WAYPOINT_KEYS <= wp.keys():
+            field = next(f for f in REQUIRED_WAYPOINT_FIELDS if f not in wp)
+            return False, f"Waypoint {i} missing required field: {field}"
         
         # Validate media field
-        media = wp.get("media", [])
+        media = wp["media"]
         if not isinstance(media, (list, dict)):
             return False, f"Waypoint {i} media must be a list or dict"
     
     # Validate state_config
-    state_config = mission.get("state_config", {})
-    if not isinstance(state_config, dict):
+    if not isinstance(mission["state_config"], dict):
         return False, "state_config must be a dictionary"
     
     return True, ""
@@ -71,6 +232,16 @@ def validate_hf_dataset_format(data: List[Dict[str, Any]]) -> Tuple[bool, str, i
     return True, "", valid_count
 
 
+def _waypoint_core(wp: Dict[str, Any]) -> Dict[str, Any]:
+    """Fields shared by the internal and HF waypoint formats; media is converted by the caller."""
+    # A literal with .get beats a comprehension over a key tuple for three fields
+    return {
+        "id": wp.get("id", ""),
+        "gt_entities": wp.get("gt_entities", {}),
+        "is_target": wp.get("is_target", False),
+    }
+
+
 def convert_mission_to_hf_format(mission: Dict[str, Any], project_path: str) -> Dict[str, Any]:
     """
     Convert internal mission format to HuggingFace dataset format.
@@ -82,11 +253,7 @@ def convert_mission_to_hf_format(mission: Dict[str, Any], project_path: str) ->
     # Process waypoints: convert media paths to list format for HF compatibility
     hf_waypoints = []
     for wp in mission.get("waypoints", []):
-        hf_wp = {
-            "id": wp.get("id", ""),
-            "gt_entities": wp.get("gt_entities", {}),
-            "is_target": wp.get("is_target", False),
-        }
+        hf_wp = _waypoint_core(wp)
         
         # Normalize media to list format for consistency
         media = wp.get("media", [])
@@ -102,7 +269,7 @@ def convert_mission_to_hf_format(mission: Dict[str, Any], project_path: str) ->
     # Build HF-compatible entry
     hf_entry = {
         # Core mission data (compatible with uav_mission_env)
-        "instruction": mission.get("mission_instruction", mission.get("instruction", "")),
+        "instruction": mission["mission_instruction"] if "mission_instruction" in mission else mission.get("instruction", ""),
         "waypoints": hf_waypoints,
         "state_config": mission.get("state_config", {}),
         
@@ -124,11 +291,7 @@ def convert_hf_format_to_mission(hf_entry: Dict[str, Any]) -> Dict[str, Any]:
     # Process waypoints: restore media format
     internal_waypoints = []
     for wp in hf_entry.get("waypoints", []):
-        internal_wp = {
-            "id": wp.get("id", ""),
-            "gt_entities": wp.get("gt_entities", {}),
-            "is_target": wp.get("is_target", False),
-        }
+        internal_wp = _waypoint_core(wp)
         
         # Restore media format
         media = wp.get("media", [])
@@ -142,17 +305,21 @@ def convert_hf_format_to_mission(hf_entry: Dict[str, Any]) -> Dict[str, Any]:
         
         internal_waypoints.append(internal_wp)
     
+    instruction = hf_entry.get("instruction", "")
+    # Random fallback id: no O(len) hash of the instruction and no modulo-10000 collisions
+    mission_id = hf_entry["id"] if "id" in hf_entry else f"imported_{uuid.uuid4().hex[:8]}"
+    
     # Build internal mission entry
     internal_entry = {
-        "id": hf_entry.get("id", f"imported_{hash(hf_entry.get('instruction', '')) % 10000}"),
+        "id": mission_id,
         "name": hf_entry.get("name", "Imported Mission"),
         "type": hf_entry.get("type", "locate_and_report"),
         "dataset_split": hf_entry.get("dataset_split", "sft_train"),
         "creation_source": hf_entry.get("creation_source", "imported"),
         "state_config": hf_entry.get("state_config", {}),
         "waypoints": internal_waypoints,
-        "instruction": hf_entry.get("instruction", ""),
-        "mission_instruction": hf_entry.get("instruction", ""),
+        "instruction": instruction,
+        "mission_instruction": instruction,
     }
     
     return internal_entry
@@ -183,6 +350,13 @@ def export_missions_to_hf_dataset(
     
     # Group missions by split
     splits = {"sft_train": [], "rl_train": [], "validation": []}
+    # Source file identity -> exported path, so an image shared by several waypoints
+    # (or hard/sym-linked under several names) is copied once
+    exported_media = {}
+    # One stat per distinct source path, however many waypoints reference it
+    identities = {}
+    # Destination -> source; keyed by destination so colliding filenames keep the old last-write-wins result
+    copy_jobs = {}
     
     for mission in missions:
         hf_entry = convert_mission_to_hf_format(mission, project_path)
@@ -201,98 +375,43 @@ def export_missions_to_hf_dataset(
                     else:
                         src_path = os.path.join(project_path, media_path)
                     
-                    if os.path.exists(src_path):
+                    if src_path not in identities:
+                        identities[src_path] = _file_identity(src_path)
+                    src_key = identities[src_path]
+                    if src_key is None:
+                        new_media.append(media_path)
+                    elif src_key in exported_media:
+                        new_media.append(exported_media[src_key])
+                    else:
                         # Create unique filename
                         filename = f"{hf_entry['id']}_{wp['id']}_{os.path.basename(media_path)}"
                         dest_path = os.path.join(images_path, filename)
-                        shutil.copy2(src_path, dest_path)
+                        copy_jobs[dest_path] = src_path
+                        exported_media[src_key] = f"images/{filename}"
                         new_media.append(f"images/{filename}")
-                    else:
-                        new_media.append(media_path)
                 else:
                     new_media.append(media_path)
             wp["media"] = new_media
         
         splits[split].append(hf_entry)
     
+    copy_files([(src, dst) for dst, src in copy_jobs.items()])
+    
     # Write split files
     for split_name, split_data in splits.items():
         if split_data:
             split_file = os.path.join(data_path, f"{split_name}.json")
-            with open(split_file, "w") as f:
-                json.dump(split_data, f, indent=2)
+            _write_json_array(split_file, split_data)
     
     # Create README.md dataset card
     total_missions = sum(len(s) for s in splits.values())
-    readme_content = f"""---
-license: mit
-task_categories:
-  - visual-question-answering
-  - robotics
-language:
-  - en
-tags:
-  - uav
-  - mission
-  - multimodal
-  - vlm
----
-
-# {dataset_name}
-
-UAV Mission Dataset for training and evaluating vision-language models on UAV navigation tasks.
-
-## Dataset Description
-
-This dataset contains **{total_missions}** missions designed for UAV visual navigation and decision-making.
-
-### Splits
-
-| Split | Count |
-|-------|-------|
-| sft_train | {len(splits['sft_train'])} |
-| rl_train | {len(splits['rl_train'])} |
-| validation | {len(splits['validation'])} |
-
-## Usage with uav_mission_env
-
-Each entry can be directly used to initialize a `MissionEnvironment`:
-
-```python
-from uav_mission_env import MissionEnvironment
-import json
-
-# Load a single entry
-with open("data/sft_train.json") as f:
-    missions = json.load(f)
-
-# Initialize environment with a specific mission
-config = {{"mission_config": missions[0]}}
-env = MissionEnvironment(config=config)
-
-# Run the mission
-obs = env.reset()
-action = {{"tool_name": "next_goal", "parameters": {{"next_goal": "waypoint_1"}}}}
-obs, reward, terminated, truncated, info = env.step(action)
-```
-
-## Data Format
-
-Each mission entry contains:
-- `instruction`: The mission goal/instruction
-- `waypoints`: List of waypoint dictionaries with:
-  - `id`: Unique identifier
-  - `gt_entities`: Ground truth entities at this location
-  - `is_target`: Whether this is the target location
-  - `media`: List of image paths
-- `state_config`: State machine configuration for the mission
-- `type`: Mission type (e.g., locate_and_report)
-- `dataset_split`: Train/validation split
-
-## License
-
-MIT License
-"""
+    readme_content = _README_TEMPLATE.format(
+        dataset_name=dataset_name,
+        total_missions=total_missions,
+        sft_train=len(splits['sft_train']),
+        rl_train=len(splits['rl_train']),
+        validation=len(splits['validation']),
+    )
     
     readme_path = os.path.join(dataset_path, "README.md")
     with open(readme_path, "w") as f:
@@ -312,13 +431,12 @@ def upload_dataset_to_hf(
     
     Returns the URL of the uploaded dataset.
     """
+    # Hub functions import huggingface_hub on first call; it costs a few hundred ms at app startup otherwise
+    from huggingface_hub import HfApi, create_repo
     api = HfApi(token=token)
     
-    # Create repo if it doesn't exist
-    try:
-        api.repo_info(repo_id=repo_id, repo_type="dataset")
-    except Exception:
-        create_repo(repo_id=repo_id, repo_type="dataset", token=token, private=private)
+    # Create repo if it doesn't exist (one request instead of a repo_info probe first)
+    create_repo(repo_id=repo_id, repo_type="dataset", token=token, private=private, exist_ok=True)
     
     # Upload the folder
     api.upload_folder(
@@ -342,6 +460,7 @@ def download_dataset_from_hf(
     
     Returns the path to the downloaded dataset.
     """
+    from huggingface_hub import snapshot_download
     return snapshot_download(
         repo_id=repo_id,
         repo_type="dataset",
@@ -358,55 +477,51 @@ def load_hf_dataset_metadata(repo_id: str, token: Optional[str] = None) -> Tuple
         Tuple of (is_valid, error_or_info_message, mission_count)
     """
     try:
-        # Download only the JSON files to a temp directory
-        with tempfile.TemporaryDirectory() as tmpdir:
-            api = HfApi(token=token)
-            
-            # List files in the repo
-            files = api.list_repo_files(repo_id=repo_id, repo_type="dataset")
-            
-            # Find data JSON files
-            json_files = [f for f in files if f.endswith('.json') and 'data/' in f]
-            
-            if not json_files:
-                # Try root-level JSON files
-                json_files = [f for f in files if f.endswith('.json')]
-            
-            if not json_files:
-                return False, "No JSON data files found in dataset", 0
-            
-            total_missions = 0
-            all_missions = []
-            
-            for json_file in json_files:
-                try:
-                    local_path = hf_hub_download(
-                        repo_id=repo_id,
-                        filename=json_file,
-                        repo_type="dataset",
-                        local_dir=tmpdir,
-                        token=token
-                    )
-                    
-                    with open(local_path, 'r') as f:
-                        data = json.load(f)
-                    
-                    if isinstance(data, list):
-                        all_missions.extend(data)
-                        total_missions += len(data)
-                except Exception as e:
-                    continue
-            
-            if total_missions == 0:
-                return False, "No missions found in dataset files", 0
-            
-            # Validate format
-            is_valid, error, valid_count = validate_hf_dataset_format(all_missions)
-            
-            if not is_valid:
-                return False, f"Format validation failed: {error}", 0
-            
-            return True, f"Found {total_missions} valid missions", total_missions
+        from huggingface_hub import HfApi, HfFileSystem
+        api = HfApi(token=token)
+        # Split files are streamed straight into the parser, no temp-dir download
+        fs = HfFileSystem(token=token)
+        
+        # List files in the repo
+        files = api.list_repo_files(repo_id=repo_id, repo_type="dataset")
+        
+        # Find data JSON files
+        json_files = [f for f in files if f.endswith('.json') and 'data/' in f]
+        
+        if not json_files:
+            # Try root-level JSON files
+            json_files = [f for f in files if f.endswith('.json')]
+        
+        if not json_files:
+            return False, "No JSON data files found in dataset", 0
+        
+        def fetch(json_file):
+            try:
+                with fs.open(f"datasets/{repo_id}/{json_file}", "rb") as f:
+                    return orjson.loads(f.read())
+            except Exception as e:
+                return None
+        
+        total_missions = 0
+        all_missions = []
+        
+        # Fetch the split files concurrently; map keeps them in listing order
+        with ThreadPoolExecutor(max_workers=min(8, len(json_files))) as executor:
+            for data in executor.map(fetch, json_files):
+                if isinstance(data, list):
+                    all_missions.extend(data)
+                    total_missions += len(data)
+        
+        if total_missions == 0:
+            return False, "No missions found in dataset files", 0
+        
+        # Validate format
+        is_valid, error, valid_count = validate_hf_dataset_format(all_missions)
+        
+        if not is_valid:
+            return False, f"Format validation failed: {error}", 0
+        
+        return True, f"Found {total_missions} valid missions", total_missions
             
     except Exception as e:
         return False, f"Failed to access dataset: {str(e)}", 0
@@ -435,18 +550,16 @@ def import_dataset_from_hf(
             if os.path.exists(data_dir):
                 json_files = [f for f in os.listdir(data_dir) if f.endswith('.json')]
                 for jf in json_files:
-                    with open(os.path.join(data_dir, jf), 'r') as f:
-                        data = json.load(f)
-                        if isinstance(data, list):
-                            all_missions.extend(data)
+                    data = _read_json_file(os.path.join(data_dir, jf))
+                    if isinstance(data, list):
+                        all_missions.extend(data)
             else:
                 # Try root level
                 json_files = [f for f in os.listdir(dataset_path) if f.endswith('.json')]
                 for jf in json_files:
-                    with open(os.path.join(dataset_path, jf), 'r') as f:
-                        data = json.load(f)
-                        if isinstance(data, list):
-                            all_missions.extend(data)
+                    data = _read_json_file(os.path.join(dataset_path, jf))
+                    if isinstance(data, list):
+                        all_missions.extend(data)
             
             if not all_missions:
                 return False, "No missions found in dataset", []
@@ -455,41 +568,49 @@ def import_dataset_from_hf(
             internal_missions = []
             images_dest = os.path.join(project_path, "images")
             os.makedirs(images_dest, exist_ok=True)
+            # Destination -> source; shared images land on one destination and are copied once
+            copy_jobs = {}
+            # Dataset path -> project path, so a shared image is only resolved once
+            imported_paths = {}
+            
+            # Every file of the snapshot from one walk, instead of a stat per media reference
+            dataset_root = os.path.normpath(dataset_path)
+            dataset_files = {
+                os.path.join(root, name) for root, _, names in os.walk(dataset_root) for name in names
+            }
+            
+            def import_media_path(path):
+                if path not in imported_paths:
+                    src_path = os.path.normpath(os.path.join(dataset_path, path))
+                    if src_path.startswith(dataset_root + os.sep):
+                        exists = src_path in dataset_files
+                    else:
+                        # Absolute paths pointing outside the snapshot
+                        exists = os.path.exists(src_path)
+                    if exists:
+                        filename = os.path.basename(path)
+                        copy_jobs[os.path.join(images_dest, filename)] = src_path
+                        imported_paths[path] = f"images/{filename}"
+                    else:
+                        imported_paths[path] = path
+                return imported_paths[path]
             
             for hf_entry in all_missions:
                 internal = convert_hf_format_to_mission(hf_entry)
                 
-                # Copy images
+                # Copy images; one code path for both media shapes
                 for wp in internal.get("waypoints", []):
                     media = wp.get("media", [])
-                    new_media = []
-                    
                     if isinstance(media, dict):
-                        new_media_dict = {}
-                        for label, path in media.items():
-                            src_path = os.path.join(dataset_path, path)
-                            if os.path.exists(src_path):
-                                filename = os.path.basename(path)
-                                dest_path = os.path.join(images_dest, filename)
-                                shutil.copy2(src_path, dest_path)
-                                new_media_dict[label] = f"images/{filename}"
-                            else:
-                                new_media_dict[label] = path
-                        wp["media"] = new_media_dict
+                        wp["media"] = {label: import_media_path(path) for label, path in media.items()}
                     else:
-                        for path in media:
-                            src_path = os.path.join(dataset_path, path)
-                            if os.path.exists(src_path):
-                                filename = os.path.basename(path)
-                                dest_path = os.path.join(images_dest, filename)
-                                shutil.copy2(src_path, dest_path)
-                                new_media.append(f"images/{filename}")
-                            else:
-                                new_media.append(path)
-                        wp["media"] = new_media
+                        wp["media"] = [import_media_path(path) for path in media]
                 
                 internal_missions.append(internal)
             
+            # Copy before the temporary download directory is cleaned up
+            copy_files([(src, dst) for dst, src in copy_jobs.items()])
+            
             return True, f"Successfully loaded {len(internal_missions)} missions", internal_missions
             
     except Exception as e:
@@ -504,18 +625,18 @@ def sync_from_hf(repo_id: str, local_dir: str, token: Optional[str] = None):
 
 def sync_to_hf(repo_id: str, local_dir: str, commit_message: str = "Update dataset via mission editor", token: Optional[str] = None):
     """Legacy: Pushes local dataset to HF."""
+    from huggingface_hub import HfApi, create_repo
     api = HfApi(token=token)
     
     # Ensure repo exists
-    try:
-        api.repo_info(repo_id=repo_id, repo_type="dataset")
-    except Exception:
-        create_repo(repo_id=repo_id, repo_type="dataset", token=token)
+    create_repo(repo_id=repo_id, repo_type="dataset", token=token, exist_ok=True)
     
     api.upload_folder(
         folder_path=local_dir,
         repo_id=repo_id,
         repo_type="dataset",
         commit_message=commit_message,
-        token=token
+        token=token,
+        # Baked grid thumbnails are a local cache, not dataset content
+        ignore_patterns=["**/.thumbs/**"]
     )
@@ -1,18 +1,30 @@
+import copy
 import json
 import os
-import glob
 import yaml
 from typing import Dict, Any, List
 
+# libyaml-backed loader/dumper when PyYAML was built with it, pure Python otherwise
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
 MISSION_TYPES_DIR = "configs/mission_types"
 
+# (file signature, parsed mission types) from the last directory scan; see _load_cached
+_cache = (None, None)
+
+# path -> ((mtime_ns, size), parsed entry), so one edited file doesn't re-parse all the others
+_parsed_files = {}
+
 
 class LiteralScalarString(str):
     """A string that will be represented as a literal block scalar in YAML."""
     pass
 
 
-class CustomDumper(yaml.SafeDumper):
+class CustomDumper(SafeDumper):
     """Custom YAML dumper that uses literal block scalar style for multiline strings."""
     pass
 
@@ -81,7 +93,29 @@ DEFAULT_MISSION_TYPES = {
     }
 }
 
-def load_mission_types() -> Dict[str, Any]:
+_CONFIG_EXTS = ('.json', '.yaml', '.yml')
+
+def _list_config_files() -> List[str]:
+    """All mission type files in one directory scan, in json/yaml/yml order like the old globs."""
+    with os.scandir(MISSION_TYPES_DIR) as entries:
+        files = [(os.path.splitext(e.name)[1], e.path) for e in entries
+                 if e.name.endswith(_CONFIG_EXTS) and not e.name.startswith('.') and e.is_file()]
+    files.sort(key=lambda f: _CONFIG_EXTS.index(f[0]))
+    return [path for _, path in files]
+
+def _file_signature(paths: List[str]):
+    try:
+        return tuple(sorted((p, st.st_mtime_ns, st.st_size) for p in paths for st in [os.stat(p)]))
+    except FileNotFoundError:
+        # A file vanished mid-scan; skip caching this round
+        return None
+
+def _load_cached() -> Dict[str, Any]:
+    """
+    Parses the mission type files only when one was added, removed or modified
+    since the last call. Callers must not mutate the returned dict.
+    """
+    global _cache, _parsed_files
     if not os.path.exists(MISSION_TYPES_DIR):
         os.makedirs(MISSION_TYPES_DIR, exist_ok=True)
         # Initialize with defaults if empty
@@ -91,9 +125,12 @@ def load_mission_types() -> Dict[str, Any]:
 
     mission_types = {}
     # Find all json and yaml/yml files
-    config_files = glob.glob(os.path.join(MISSION_TYPES_DIR, "*.json")) + \
-                   glob.glob(os.path.join(MISSION_TYPES_DIR, "*.yaml")) + \
-                   glob.glob(os.path.join(MISSION_TYPES_DIR, "*.yml"))
+    config_files = _list_config_files()
+    
+    # Any added/removed/rewritten file changes the signature; only the changed files are re-parsed
+    signature = _file_signature(config_files)
+    if signature is not None and _cache[0] == signature:
+        return _cache[1]
     
     if not config_files:
         # Fallback to defaults and save them as JSON by default
@@ -109,11 +146,19 @@ def load_mission_types() -> Dict[str, Any]:
         if base_name not in found_files or ext in ['.yaml', '.yml']:
             found_files[base_name] = file_path
 
+    stamps = {path: (mtime_ns, size) for path, mtime_ns, size in signature or ()}
+    parsed_files = {}
     for name, file_path in found_files.items():
+        stamp = stamps.get(file_path)
+        cached = _parsed_files.get(file_path)
+        if stamp is not None and cached is not None and cached[0] == stamp:
+            parsed_files[file_path] = cached
+            mission_types[name] = cached[1]
+            continue
         try:
             with open(file_path, 'r') as f:
                 if file_path.endswith(('.yaml', '.yml')):
-                    data = yaml.safe_load(f)
+                    data = yaml.load(f, Loader=SafeLoader)
                 else:
                     data = json.load(f)
                 
@@ -128,16 +173,33 @@ def load_mission_types() -> Dict[str, Any]:
                     }
         except (json.JSONDecodeError, yaml.YAMLError, IOError):
             continue
-            
+        if stamp is not None:
+            parsed_files[file_path] = (stamp, mission_types[name])
+    
+    _parsed_files = parsed_files
+    _cache = (signature, mission_types)
     return mission_types
 
+def _invalidate_cache():
+    global _cache
+    _cache = (None, None)
+
+def load_mission_types() -> Dict[str, Any]:
+    # Views edit the returned configs in place, so hand out a private copy
+    return copy.deepcopy(_load_cached())
+
 def save_mission_type(name: str, config: Dict[str, Any], prefer_yaml: bool = False):
     os.makedirs(MISSION_TYPES_DIR, exist_ok=True)
+    _invalidate_cache()
     
     # Check if a file already exists to preserve format
     json_path = os.path.join(MISSION_TYPES_DIR, f"{name}.json")
     yaml_path = os.path.join(MISSION_TYPES_DIR, f"{name}.yaml")
     
+    # A same-size rewrite within the mtime granularity would otherwise reuse the old parse
+    _parsed_files.pop(json_path, None)
+    _parsed_files.pop(yaml_path, None)
+    
     # Remove ui_metadata before saving (it's editor-only data, not part of the config)
     config_to_save = {k: v for k, v in config.items() if k != 'ui_metadata'}
     
@@ -156,32 +218,32 @@ def save_mission_types(types_config: Dict[str, Any]):
     """Saves all mission types, deleting files for keys not in types_config."""
     os.makedirs(MISSION_TYPES_DIR, exist_ok=True)
     
-    # Current files
-    existing_files = glob.glob(os.path.join(MISSION_TYPES_DIR, "*.json")) + \
-                     glob.glob(os.path.join(MISSION_TYPES_DIR, "*.yaml")) + \
-                     glob.glob(os.path.join(MISSION_TYPES_DIR, "*.yml"))
-    existing_names = [os.path.splitext(os.path.basename(f))[0] for f in existing_files]
+    # Current files, grouped by type name (a name can have both a .json and a .yaml)
+    existing = {}
+    for file_path in _list_config_files():
+        existing.setdefault(os.path.splitext(os.path.basename(file_path))[0], []).append(file_path)
     
     # Save/Update (preserves existing format)
     for name, config in types_config.items():
         save_mission_type(name, config)
         
-    # Delete removed types
-    for name in set(existing_names):
-        if name not in types_config:
-            # Delete both possible extensions
-            for ext in ['.json', '.yaml', '.yml']:
-                file_path = os.path.join(MISSION_TYPES_DIR, f"{name}{ext}")
-                if os.path.exists(file_path):
-                    os.remove(file_path)
+    # Delete removed types: exactly the files found above, no per-extension probing
+    for name in existing.keys() - types_config.keys():
+        for file_path in existing[name]:
+            os.remove(file_path)
 
 def get_mission_type_names() -> List[str]:
-    return list(load_mission_types().keys())
+    return list(_load_cached().keys())
+
+def get_mission_type(name: str) -> Dict[str, Any]:
+    """Private copy of a single mission type ({} if unknown), without copying all the others."""
+    return copy.deepcopy(_load_cached().get(name, {}))
 
 
 def delete_mission_type(name: str) -> bool:
     """Delete a mission type by name. Returns True if deleted, False if not found."""
     deleted = False
+    _invalidate_cache()
     for ext in ['.json', '.yaml', '.yml']:
         file_path = os.path.join(MISSION_TYPES_DIR, f"{name}{ext}")
         if os.path.exists(file_path):
@@ -1,28 +1,32 @@
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Tuple
 import streamlit as st
-from PIL import Image, ImageOps
+from PIL import Image
 
-def navigate_to(page):
-    """Simple navigation helper using session state."""
-    st.session_state.page = page
-    st.rerun()
+# Baked thumbnails live in this hidden folder next to their image
+THUMBS_DIRNAME = ".thumbs"
 
-def get_badge_html(tag_type):
-    """Returns HTML for a mission tag badge."""
-    return f'<span class="badge-{tag_type}">{tag_type.replace("_", " ").title()}</span>'
+# EXIF Orientation tag (274) -> the transpose that makes the pixels upright
+EXIF_ORIENTATION = 0x0112
+EXIF_TRANSPOSE = {
+    2: Image.Transpose.FLIP_LEFT_RIGHT,
+    3: Image.Transpose.ROTATE_180,
+    4: Image.Transpose.FLIP_TOP_BOTTOM,
+    5: Image.Transpose.TRANSPOSE,
+    6: Image.Transpose.ROTATE_270,
+    7: Image.Transpose.TRANSVERSE,
+    8: Image.Transpose.ROTATE_90,
+}
 
-@st.dialog("Media Preview", width="large")
-def preview_media(file_path):
-    """Dialog for previewing images or video."""
-    if file_path.lower().endswith(('.png', '.jpg', '.jpeg')):
-        img = Image.open(file_path)
-        img = ImageOps.exif_transpose(img)
-        st.image(img)
-    elif file_path.lower().endswith(('.mp4', '.avi', '.mov')):
-        st.video(file_path)
+# Threads that decode thumbnails ahead of an image grid; PIL releases the GIL while decoding
+THUMB_WORKERS = 4
+_THUMB_POOL = ThreadPoolExecutor(max_workers=THUMB_WORKERS, thread_name_prefix="thumbs")
 
-def apply_custom_styles():
-    """Injects custom CSS into the Streamlit app."""
-    st.markdown("""
+# Built once at import; apply_custom_styles just hands the same string to st.markdown
+_CSS_HTML = """
     <style>
         .main { background-color: #f8f9fa; }
         .stButton>button { width: 100%; border-radius: 5px; height: 3em; }
@@ -50,16 +54,143 @@ def apply_custom_styles():
         .badge-manual { background-color: #e3f2fd; color: #0d47a1; padding: 2px 6px; border-radius: 4px; font-size: 0.75em; border: 1px solid #90caf9; }
         .badge-synthetic { background-color: #f3e5f5; color: #7b1fa2; padding: 2px 6px; border-radius: 4px; font-size: 0.75em; border: 1px solid #ce93d8; }
         
+        /* Name | type | split | instruction cells of a project overview row, rendered as one markdown block */
+        .mission-row { display: grid; grid-template-columns: 1.5fr 1.5fr 1fr 3fr; gap: 1rem; align-items: center; }
+        .mission-instruction { color: rgba(49, 51, 63, 0.6); font-size: 0.875rem; }
+        
         /* Hide sidebar navigation */
         [data-testid="stSidebarNav"] { display: none; }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+def navigate_to(page):
+    """Simple navigation helper using session state."""
+    st.session_state.page = page
+    # Views render as fragments, so the page switch needs a full app rerun
+    st.rerun(scope="app")
+
+# Badge helpers run once per mission row; the tag vocabulary is tiny, so memoize the HTML
+@lru_cache(maxsize=256)
+def get_badge_html(tag_type):
+    """Returns HTML for a mission tag badge."""
+    return f'<span class="badge-{tag_type}">{tag_type.replace("_", " ").title()}</span>'
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _load_preview(file_path: str, mtime_ns: int) -> bytes:
+    """Upright image bytes for the preview dialog (the original file unless EXIF rotates it); mtime_ns invalidates edited files."""
+    with Image.open(file_path) as img:
+        if exif_orientation(img) == 1:
+            # Already upright: hand over the original file as-is, no decode or re-encode
+            with open(file_path, "rb") as f:
+                return f.read()
+        img = _upright(img)
+        buf = io.BytesIO()
+        # Fast zlib level: the bytes only travel to the browser once per cache entry
+        img.save(buf, format="PNG", compress_level=1)
+    return buf.getvalue()
+
+def exif_orientation(img: Image.Image) -> int:
+    """EXIF orientation of an opened image (1 = upright); reads metadata only, no pixels."""
+    return img.getexif().get(EXIF_ORIENTATION, 1)
+
+def _upright(img: Image.Image) -> Image.Image:
+    """
+    Applies the EXIF orientation with a direct transpose; unlike ImageOps.exif_transpose
+    it skips rebuilding the EXIF block, which the re-encoded bytes never carry anyway.
+    """
+    method = EXIF_TRANSPOSE.get(exif_orientation(img))
+    return img.transpose(method) if method is not None else img
+
+def _encode_thumbnail(source, max_side: int) -> Tuple[bytes, int, int]:
+    """`source` is a path or a binary file object."""
+    with Image.open(source) as img:
+        # Lets the JPEG decoder scale down while decoding instead of inflating the full frame
+        img.draft("RGB", (max_side, max_side))
+        img = _upright(img)
+        img.thumbnail((max_side, max_side))
+        buf = io.BytesIO()
+        img.convert("RGB").save(buf, format="JPEG", quality=80)
+    return buf.getvalue(), img.width, img.height
+
+def thumbnail_path(file_path: str, max_side: int, size: int, mtime_ns: int) -> str:
+    """
+    Where bake_thumbnail stores the thumbnail of `file_path` (a .thumbs folder next to it). The image's size and
+    mtime are part of the name, so a replaced image (even one copied with an older mtime) never matches it.
+    """
+    folder, name = os.path.split(file_path)
+    return os.path.join(folder, THUMBS_DIRNAME, name, f"{max_side}.{size}-{mtime_ns}.jpg")
+
+# A plain lru_cache rather than st.cache_data: prefetch_thumbnails fills it from pool threads, which have no
+# ScriptRunContext (st.cache_data logs a warning per call there). The cached tuples are immutable.
+@lru_cache(maxsize=512)
+def _load_thumbnail(file_path: str, size: int, mtime_ns: int, max_side: int) -> Tuple[bytes, int, int]:
+    """Downscaled, EXIF-corrected JPEG bytes for inline image grids, with their width and height."""
+    # A thumbnail baked at upload time skips decoding the full-size original
+    try:
+        with open(thumbnail_path(file_path, max_side, size, mtime_ns), "rb") as f:
+            data = f.read()
+        with Image.open(io.BytesIO(data)) as img:
+            return data, img.width, img.height
+    except OSError:
+        pass
+    return _encode_thumbnail(file_path, max_side)
+
+def bake_thumbnail(file_path: str, max_side: int, source=None):
+    """
+    Writes the thumbnail of a freshly saved image to disk so later loads never decode the original.
+    Pass the in-memory upload as `source` to skip reading the file back.
+    """
+    data, _, _ = _encode_thumbnail(source if source is not None else file_path, max_side)
+    file_stat = os.stat(file_path)
+    baked = thumbnail_path(file_path, max_side, file_stat.st_size, file_stat.st_mtime_ns)
+    os.makedirs(os.path.dirname(baked), exist_ok=True)
+    with open(baked, "wb") as f:
+        f.write(data)
+    # Drop the thumbnails baked for earlier versions of the image
+    with os.scandir(os.path.dirname(baked)) as entries:
+        for entry in entries:
+            if entry.name.startswith(f"{max_side}.") and entry.path != baked:
+                os.remove(entry.path)
+
+def load_thumbnail(file_path: str, max_side: int = 512) -> Tuple[bytes, int, int]:
+    """Cached (JPEG bytes, width, height) thumbnail of an image file; re-encoded only when the file changes."""
+    file_stat = os.stat(file_path)
+    return _load_thumbnail(file_path, file_stat.st_size, file_stat.st_mtime_ns, max_side)
+
+def _warm_thumbnail(file_path: str, max_side: int):
+    try:
+        load_thumbnail(file_path, max_side)
+    except Exception:
+        pass  # Missing or broken files are reported by the grid itself
+
+def prefetch_thumbnails(file_paths, max_side: int = 512):
+    """Fills the thumbnail cache for `file_paths` in parallel, so the grid's load_thumbnail calls are cache hits."""
+    list(_THUMB_POOL.map(lambda p: _warm_thumbnail(p, max_side), file_paths))
+
+def load_preview(file_path: str) -> bytes:
+    """Cached full-resolution, EXIF-corrected bytes of an image file."""
+    return _load_preview(file_path, os.stat(file_path).st_mtime_ns)
+
+@st.dialog("Media Preview", width="large")
+def preview_media(file_path):
+    """Dialog for previewing images or video."""
+    if file_path.lower().endswith(('.png', '.jpg', '.jpeg')):
+        st.image(load_preview(file_path))
+    elif file_path.lower().endswith(('.mp4', '.avi', '.mov')):
+        st.video(file_path)
+
+def apply_custom_styles():
+    """Injects custom CSS into the Streamlit app."""
+    # Re-emitted on every full run: Streamlit drops elements a run doesn't produce
+    st.markdown(_CSS_HTML, unsafe_allow_html=True)
 
+@lru_cache(maxsize=256)
 def get_split_badge_html(split_name):
     """Returns HTML for a dataset split badge."""
     if not split_name: return ""
     return f'<span class="badge-{split_name}">{split_name.replace("_", " ").upper()}</span>'
 
+@lru_cache(maxsize=256)
 def get_source_badge_html(source_name):
     """Returns HTML for a creation source badge."""
     if not source_name: return ""
@@ -1,7 +1,30 @@
 import streamlit as st
+import pandas as pd
 from utils.ui_utils import navigate_to
+from utils.data_utils import latest_generation_run, start_generation_log
 from utils.mission_types_manager import get_mission_type_names
 
+def edit_ratios(names: list, ratios: dict, name_label: str, key: str):
+    """One data_editor for the selected names' ratios instead of a number_input per name."""
+    edited = st.data_editor(
+        pd.DataFrame({name_label: names, "Ratio": [ratios.get(n, 1.0) for n in names]}),
+        # Row edits are positional, so a different selection gets a fresh editor
+        key=f"{key}_{'|'.join(names)}",
+        hide_index=True,
+        num_rows="fixed",
+        disabled=[name_label],
+        column_config={"Ratio": st.column_config.NumberColumn(min_value=0.0, step=0.1)}
+    )
+    # A cleared cell comes back as NaN; treat it as "don't generate"
+    ratios.update(zip(edited[name_label], edited["Ratio"].fillna(0.0).tolist()))
+
+def describe_ratios(names: list, ratios: dict) -> str:
+    values = [ratios.get(n, 1.0) for n in names]
+    if len(set(values)) == 1:
+        return "Uniform distribution"
+    return "Ratios: " + " · ".join(f"{n} {v:g}" for n, v in zip(names, values))
+
+@st.fragment
 def render_agentic_creation():
     st.title("✨ Agentic Mission Creation")
     
@@ -65,18 +88,12 @@ def render_agentic_creation():
         )
         
         if selected_tags:
-            st.caption("Adjust relative weights (ratios) for selected tags:")
-            cols = st.columns(len(selected_tags))
-            for i, tag in enumerate(selected_tags):
-                with cols[i]:
-                    st.markdown(f"**{tag}**")
-                    st.session_state.ac_tag_ratios[tag] = st.number_input(
-                        "Ratio", 
-                        min_value=0.0, 
-                        value=st.session_state.ac_tag_ratios.get(tag, 1.0), 
-                        step=0.1, 
-                        key=f"ratio_tag_{tag}"
-                    )
+            # The editor only renders on request; otherwise the current ratios are summarized
+            if st.checkbox("Customize ratios", key="ac_customize_tags"):
+                st.caption("Adjust relative weights (ratios) for selected tags:")
+                edit_ratios(selected_tags, st.session_state.ac_tag_ratios, "Tag", key="ratio_tags")
+            else:
+                st.caption(describe_ratios(selected_tags, st.session_state.ac_tag_ratios))
 
     # --- 4. Ratios: Dataset Splits ---
     st.subheader("4. Dataset Split Distribution")
@@ -93,22 +110,25 @@ def render_agentic_creation():
         )
         
         if selected_splits:
-            st.caption("Adjust relative weights (ratios) for selected splits:")
-            cols = st.columns(len(selected_splits))
-            for i, split in enumerate(selected_splits):
-                with cols[i]:
-                    st.markdown(f"**{split}**")
-                    st.session_state.ac_split_ratios[split] = st.number_input(
-                        "Ratio", 
-                        min_value=0.0, 
-                        value=st.session_state.ac_split_ratios.get(split, 1.0), 
-                        step=0.1, 
-                        key=f"ratio_split_{split}"
-                    )
+            # The editor only renders on request; otherwise the current ratios are summarized
+            if st.checkbox("Customize ratios", key="ac_customize_splits"):
+                st.caption("Adjust relative weights (ratios) for selected splits:")
+                edit_ratios(selected_splits, st.session_state.ac_split_ratios, "Split", key="ratio_splits")
+            else:
+                st.caption(describe_ratios(selected_splits, st.session_state.ac_split_ratios))
 
     # --- Generate Action (Stub) ---
     st.divider()
+    # A new session (reload/restart) can pick up the missions of the last run instead of regenerating them
+    if 'gen_total_missions' not in st.session_state and latest_generation_run(st.session_state.get('current_project')):
+        if st.button("📂 Restore Last Run"):
+            navigate_to('generation_progress')
     if st.button("🚀 Generate Missions", type="primary"):
+        # Detach any worker left over from a previous run; its late results go to a queue nobody reads
+        if 'gen_stop' in st.session_state: st.session_state.gen_stop.set()
+        for key in ('gen_thread', 'gen_results', 'gen_stop'):
+            st.session_state.pop(key, None)
+        
         # Capture Config (Implicitly in session state or usage logic)
         st.session_state.gen_total_missions = num_missions
         st.session_state.gen_processed_count = 0
@@ -121,6 +141,9 @@ def render_agentic_creation():
         import time
         from datetime import datetime
         st.session_state.gen_start_time = datetime.now().timestamp()
+        st.session_state.gen_run_id = start_generation_log(
+            st.session_state.get('current_project'), num_missions, st.session_state.gen_start_time
+        )
         
         # Use navigate_to for internal session-state routing
         navigate_to('generation_progress')
@@ -2,15 +2,248 @@ import streamlit as st
 import time
 import random
 import os
-import shutil
-from datetime import datetime
-import json
-from utils.ui_utils import navigate_to
-from utils.data_utils import save_project_data, get_project_path
-from utils.mission_types_manager import load_mission_types
+import queue
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import accumulate
+import orjson
+from utils.ui_utils import navigate_to, load_thumbnail
+from utils.hf_utils import copy_files
+from utils.data_utils import (save_project_data, get_project_path, append_generation_log, load_generation_log,
+                              latest_generation_run, mark_generation_run_imported)
 from data_gen.mission_gen_pipeline import MissionGenPipeline
 from utils.config_manager import load_config
 
+# Missions generated concurrently by the background worker
+GENERATION_WORKERS = 4
+# Log entries rendered by default; the rest sit behind the "Show full history" toggle
+LOG_PAGE_SIZE = 20
+# How often the live stats redraw while the worker runs
+STATS_REFRESH_SECONDS = 1
+
+@st.cache_resource(show_spinner=False)
+def get_pipeline(api_key: str, instruction_vlm: str, image_generation_model: str,
+                 verification_vlm: str, waypoints_per_mission: int) -> MissionGenPipeline:
+    """One pipeline per (key, models, waypoint count) instead of one per generated mission."""
+    return MissionGenPipeline(
+        api_key=api_key,
+        instruction_vlm=instruction_vlm,
+        image_generation_model=image_generation_model,
+        verification_vlm=verification_vlm,
+        waypoints_per_mission=waypoints_per_mission
+    )
+
+def format_hms(seconds: float) -> str:
+    """HH:MM:SS without the gmtime/strftime round-trip (hours keep counting past a day)."""
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+
+@lru_cache(maxsize=4096)
+def _absolute_media_path(path: str) -> str:
+    return path if os.path.isabs(path) else os.path.abspath(path)
+
+def resolve_media_path(path: str) -> tuple:
+    """
+    (absolute path, exists) for a generated media path.
+    Only the path is cached; files can still be written, removed or re-created, so existence is checked per call.
+    """
+    abs_path = _absolute_media_path(path)
+    return abs_path, os.path.exists(abs_path)
+
+def weighted_pool(ratios: dict, fallback: str) -> tuple:
+    """(choices, cumulative weights) for random.choices, built once per generation run."""
+    choices = [k for k, r in ratios.items() if r > 0]
+    if not choices: return [fallback], [1.0]
+    return choices, list(accumulate(ratios[k] for k in choices))
+
+def generate_one(pipeline: MissionGenPipeline, m_name: str, tag_pool: tuple, split_pool: tuple) -> dict:
+    """Runs the pipeline for one mission and returns the log entry (a failed entry on error)."""
+    try:
+        # Weighted choice of mission type and split from the precomputed pools
+        selected_type = random.choices(tag_pool[0], cum_weights=tag_pool[1])[0]
+        selected_split = random.choices(split_pool[0], cum_weights=split_pool[1])[0]
+
+        # Run Pipeline
+        # Note: pipeline.run_pipeline returns the mission dictionary directly
+        new_entry = pipeline.run_pipeline(
+            mission_type_str=selected_type,
+            dataset_split=selected_split
+        )
+        
+        # Post-process entry to match our view requirements
+        new_entry['name'] = m_name
+        # Ensure status is set based on validation
+        val_res = new_entry.get('validation_result', {})
+        if val_res.get('mission_is_valid'):
+            new_entry['status'] = 'success'
+        elif val_res.get('needs_human_review'):
+             new_entry['status'] = 'verified_fail' # Or maybe review needed
+        else:
+            new_entry['status'] = 'failed'
+            
+        # If pipeline returned 'failed' id explicitly
+        if new_entry.get('id') == 'failed':
+             new_entry['status'] = 'failed'
+        # Ids also key the entry's widgets, so they must stay unique across concurrent workers
+        new_entry['id'] = f"gen_{uuid.uuid4().hex}"
+
+    except Exception as e:
+        new_entry = {
+            "id": f"err_{uuid.uuid4().hex}",
+            "name": m_name,
+            "type": "error",
+            "status": "failed",
+            "instruction": f"Error during generation: {str(e)}",
+            "state_config": {},
+            "waypoints": []
+        }
+    return new_entry
+
+def generation_worker(pipeline: MissionGenPipeline, run_id: str, names: list, tag_pool: tuple, split_pool: tuple,
+                      results: queue.Queue, stop_event: threading.Event):
+    """
+    Background thread: generates the named missions and hands each entry to the view through `results`.
+    Runs without a Streamlit script context, so it must not touch st.session_state.
+    """
+    def run(m_name):
+        # Missions still waiting for a slot are skipped once Stop was pressed
+        if stop_event.is_set():
+            return None
+        return generate_one(pipeline, m_name, tag_pool, split_pool)
+
+    # Missions are independent and I/O bound; the shared Gemini rate limiters keep the pool within quota
+    with ThreadPoolExecutor(max_workers=min(GENERATION_WORKERS, len(names))) as executor:
+        for future in as_completed([executor.submit(run, m_name) for m_name in names]):
+            new_entry = future.result()
+            # Nothing more is recorded once Stop was pressed or the run was replaced
+            if new_entry is not None and not stop_event.is_set():
+                append_generation_log(run_id, new_entry)
+                results.put(new_entry)
+
+def start_generation_worker(pipeline: MissionGenPipeline, names: list):
+    st.session_state.gen_results = queue.Queue()
+    st.session_state.gen_stop = threading.Event()
+    st.session_state.gen_thread = threading.Thread(
+        target=generation_worker,
+        args=(pipeline, st.session_state.gen_run_id, names,
+              weighted_pool(st.session_state.get('ac_tag_ratios', {}), "locate_and_report"),
+              weighted_pool(st.session_state.get('ac_split_ratios', {}), "sft_train"),
+              st.session_state.gen_results, st.session_state.gen_stop),
+        daemon=True
+    )
+    st.session_state.gen_thread.start()
+
+def restore_generation_state() -> bool:
+    """
+    Rebuilds the progress state from the log of the current project's last run (if not imported yet)
+    for review/import; nothing is regenerated.
+    """
+    run_id = latest_generation_run(st.session_state.get('current_project'))
+    restored = load_generation_log(run_id) if run_id else None
+    if restored is None:
+        return False
+    header, entries = restored
+    st.session_state.gen_total_missions = len(entries)
+    st.session_state.gen_processed_count = len(entries)
+    st.session_state.gen_log = entries
+    st.session_state.is_generating = False
+    st.session_state.gen_retry_queue = []
+    st.session_state.gen_name_counter = header['total'] + 1
+    st.session_state.gen_start_time = header['start_time']
+    st.session_state.gen_run_id = run_id
+    st.toast(f"Restored {len(entries)} missions from the last generation run")
+    return True
+
+def drain_generation_results():
+    """Moves finished missions from the worker queue into the log."""
+    results = st.session_state.get('gen_results')
+    while results is not None:
+        try:
+            new_entry = results.get_nowait()
+        except queue.Empty:
+            break
+        st.session_state.gen_log.append(new_entry)
+        st.session_state.gen_processed_count += 1
+
+def generation_running() -> bool:
+    thread = st.session_state.get('gen_thread')
+    return thread is not None and thread.is_alive()
+
+def render_progress_stats(processed: int, total: int):
+    """Progress, elapsed and ETA metrics."""
+    # Calculate Time (gen_start_time is a wall-clock timestamp)
+    elapsed = time.time() - st.session_state.gen_start_time
+    elapsed_str = format_hms(elapsed)
+    
+    # Estimate Remaining
+    eta_str = format_hms(elapsed / processed * (total - processed)) if processed > 0 else "--:--:--"
+
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("Progress", f"{processed}/{total}")
+    c2.metric("Elapsed", elapsed_str)
+    c3.metric("Est. Remaining", eta_str)
+
+@st.fragment(run_every=STATS_REFRESH_SECONDS)
+def render_live_progress_stats(total: int):
+    """
+    Ticks the stats on its own while the worker runs, leaving the rest of the page idle
+    so clicks are handled right away. The page reruns once a mission is handed over or the worker exits.
+    """
+    if not st.session_state.gen_results.empty() or not generation_running():
+        st.rerun()
+    render_progress_stats(st.session_state.gen_processed_count, total)
+
+def rerun_after_review():
+    """While generating only the reviewed row changes; afterwards the import summary counts it too."""
+    st.rerun(scope="fragment" if st.session_state.is_generating else "app")
+
+@st.fragment
+def render_log_item(i: int, item: dict):
+    """One log row, rerun on its own for accept/reject; `i` is the entry's index in gen_log (retry removes it)."""
+    c_icon, c_info, c_act = st.columns([0.5, 2.5, 2])
+
+    icon = "✅" 
+    if item['status'] == 'failed': icon = "❌"
+    elif item['status'] == 'verified_fail': icon = "⚠️"
+
+    c_icon.markdown(f"### {icon}")
+    c_info.markdown(f"**{item['name']}**")
+    c_info.caption(f"Status: {item['status']} | Type: {item['type']}")
+
+    # Actions
+    with c_act:
+        # Common Inspect Button
+        ic1, ic2, ic3 = st.columns([1, 1, 1])
+        if ic1.button("🔍", key=f"insp_{item['id']}"):
+            inspect_dialog(item)
+
+        if item['status'] == 'success':
+            # Allow Reject override
+            if ic3.button("❌", key=f"rej_suc_{item['id']}"):
+                item['status'] = 'failed'
+                rerun_after_review()
+
+        elif item['status'] == 'verified_fail':
+            if ic2.button("✅", key=f"acc_{item['id']}"):
+                item['status'] = 'success'
+                rerun_after_review()
+            if ic3.button("❌", key=f"rej_{item['id']}"):
+                item['status'] = 'failed'
+                rerun_after_review()
+
+        elif item['status'] == 'failed':
+            if ic2.button("🔄", key=f"retry_{item['id']}", help="Retry Generation"):
+                # Remove from log and decrement processed count to trigger re-generation
+                st.session_state.gen_retry_queue.append(item['name'])
+                st.session_state.gen_log.pop(i)
+                st.session_state.gen_processed_count -= 1
+                st.session_state.is_generating = True
+                st.rerun()
+    st.divider()
+
 @st.dialog("Mission Inspector", width="large")
 def inspect_dialog(item):
     st.subheader(f"{item['name']}")
@@ -44,13 +277,9 @@ def inspect_dialog(item):
                     for idx, (m_path, label) in enumerate(zip(media_paths, media_labels)):
                         with cols[idx]:
                             # Resolve absolute path (images are in outputs/ relative to app dir)
-                            if os.path.isabs(m_path):
-                                abs_path = m_path
-                            else:
-                                abs_path = os.path.abspath(m_path)
-                            
-                            if os.path.exists(abs_path):
-                                st.image(abs_path, caption=label, width='stretch')
+                            abs_path, found = resolve_media_path(m_path)
+                            if found:
+                                st.image(load_thumbnail(abs_path)[0], caption=label, width='stretch')
                             else:
                                 st.warning(f"Image not found: {m_path}")
                 
@@ -62,7 +291,7 @@ def inspect_dialog(item):
                         st.text(f"  • {lm.get('category', 'Unknown')}: {lm.get('name', 'N/A')}")
     
     with st.expander("State Configuration", expanded=False):
-        st.json(item.get('state_config', {}))
+        st.code(orjson.dumps(item.get('state_config', {}), option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode(), language='json')
         
     st.divider()
     col1, col2 = st.columns(2)
@@ -73,38 +302,60 @@ def inspect_dialog(item):
         item['status'] = 'failed'
         st.rerun()
 
+@st.fragment
 def render_generation_progress():
     st.title("🚀 Generating Missions...")
     
-    # State Initialization check
-    if 'gen_total_missions' not in st.session_state:
+    # State Initialization check; a fresh session picks up the last run's log instead
+    if 'gen_total_missions' not in st.session_state and not restore_generation_state():
         st.warning("No generation process active.")
         if st.button("Back"): navigate_to('agentic_creation')
         return
 
-    # --- Header Stats ---
+    # Pick up whatever the background worker finished since the last run
+    drain_generation_results()
+
     total = st.session_state.gen_total_missions
     processed = st.session_state.gen_processed_count
-    
-    # Calculate Time
-    start_time = st.session_state.gen_start_time
-    elapsed = datetime.now().timestamp() - start_time
-    elapsed_str = time.strftime("%H:%M:%S", time.gmtime(elapsed))
-    
-    # Estimate Remaining
-    eta_str = "--:--:--"
-    if processed > 0:
-        avg_time = elapsed / processed
-        remaining_count = total - processed
-        eta_seconds = remaining_count * avg_time
-        eta_str = time.strftime("%H:%M:%S", time.gmtime(eta_seconds))
 
-    c1, c2, c3, c4 = st.columns(4)
-    c1.metric("Progress", f"{processed}/{total}")
-    c2.metric("Elapsed", elapsed_str)
-    c3.metric("Est. Remaining", eta_str)
+    # --- Generation (background worker) ---
+    if st.session_state.is_generating and processed < total and not generation_running():
+        config = load_config()
+        api_key = config.get("gemini_api_key")
+        
+        if not api_key:
+            st.error("Gemini API Key not found in settings!")
+            st.session_state.is_generating = False
+            st.stop()
+
+        # Pipeline for the selected models, shared across reruns
+        pipeline = get_pipeline(
+            api_key=api_key,
+            instruction_vlm=st.session_state.get("ac_model_vlm", "gemini-2.5-flash-lite"),
+            image_generation_model=st.session_state.get("ac_model_img", "gemini-2.5-flash-image"),
+            verification_vlm=st.session_state.get("ac_model_verif", "gemini-2.5-flash-lite"),
+            waypoints_per_mission=st.session_state.get("gen_waypoints_per_mission", 3) # Need to ensure this is passed or default
+        )
+
+        # Determine Names (Retries first, then new ones)
+        names = []
+        for _ in range(total - processed):
+            if st.session_state.get('gen_retry_queue'):
+                names.append(st.session_state.gen_retry_queue.pop(0))
+            else:
+                ctr = st.session_state.get('gen_name_counter', 1)
+                names.append(f"Generated Mission {ctr}")
+                st.session_state.gen_name_counter = ctr + 1
+        start_generation_worker(pipeline, names)
+    
+    # --- Header Stats ---
+    if st.session_state.is_generating and processed < total:
+        render_live_progress_stats(total)
+    else:
+        render_progress_stats(processed, total)
     if st.button("🛑 Stop / Back"):
         st.session_state.is_generating = False
+        if 'gen_stop' in st.session_state: st.session_state.gen_stop.set()
         navigate_to('agentic_creation')
 
     # Progress Bar
@@ -124,139 +375,18 @@ def render_generation_progress():
                 cols[0].markdown("### 🔄") 
                 cols[1].markdown(f"**Generating Mission #{processed + 1}...**")
                 
-        # Show history
-        # Iterate with index to allow modification
-        for i in range(len(st.session_state.gen_log) - 1, -1, -1):
-            item = st.session_state.gen_log[i]
-            c_icon, c_info, c_act = st.columns([0.5, 2.5, 2])
-            
-            icon = "✅" 
-            if item['status'] == 'failed': icon = "❌"
-            elif item['status'] == 'verified_fail': icon = "⚠️"
-            
-            c_icon.markdown(f"### {icon}")
-            c_info.markdown(f"**{item['name']}**")
-            c_info.caption(f"Status: {item['status']} | Type: {item['type']}")
-            
-            # Actions
-            with c_act:
-                # Common Inspect Button
-                ic1, ic2, ic3 = st.columns([1, 1, 1])
-                if ic1.button("🔍", key=f"insp_{item['id']}"):
-                    inspect_dialog(item)
-
-                if item['status'] == 'success':
-                    # Allow Reject override
-                    if ic3.button("❌", key=f"rej_suc_{item['id']}"):
-                        item['status'] = 'failed'
-                        st.rerun()
-                        
-                elif item['status'] == 'verified_fail':
-                    if ic2.button("✅", key=f"acc_{item['id']}"):
-                        item['status'] = 'success'
-                        st.rerun()
-                    if ic3.button("❌", key=f"rej_{item['id']}"):
-                        item['status'] = 'failed'
-                        st.rerun()
-                        
-                elif item['status'] == 'failed':
-                    if ic2.button("🔄", key=f"retry_{item['id']}", help="Retry Generation"):
-                        # Remove from log and decrement processed count to trigger re-generation
-                        st.session_state.gen_retry_queue.append(item['name'])
-                        st.session_state.gen_log.pop(i)
-                        st.session_state.gen_processed_count -= 1
-                        st.session_state.is_generating = True
-                        st.rerun()
-            st.divider()
-
-    # --- Simulation Logic (Demo) ---
-    if st.session_state.is_generating and processed < total:
-        time.sleep(1.5) # Simulate work
-        
-        # Determine Name (Retry or New)
-        if st.session_state.get('gen_retry_queue'):
-            m_name = st.session_state.gen_retry_queue.pop(0)
-        else:
-            ctr = st.session_state.get('gen_name_counter', 1)
-            m_name = f"Generated Mission {ctr}"
-            st.session_state.gen_name_counter = ctr + 1
-        
-        # Real Pipeline Execution
-        try:
-            config = load_config()
-            api_key = config.get("gemini_api_key")
-            
-            if not api_key:
-                st.error("Gemini API Key not found in settings!")
-                st.session_state.is_generating = False
-                st.stop()
-
-            # Initialize pipeline with selected models
-            pipeline = MissionGenPipeline(
-                api_key=api_key,
-                instruction_vlm=st.session_state.get("ac_model_vlm", "gemini-2.5-flash-lite"),
-                image_generation_model=st.session_state.get("ac_model_img", "gemini-2.5-flash-image"),
-                verification_vlm=st.session_state.get("ac_model_verif", "gemini-2.5-flash-lite"),
-                waypoints_per_mission=st.session_state.get("gen_waypoints_per_mission", 3) # Need to ensure this is passed or default
-            )
-
-            # Determine Mission Type based on ratios
-            available_tags = [t for t, r in st.session_state.get('ac_tag_ratios', {}).items() if r > 0]
-            if not available_tags: available_tags = ["locate_and_report"] # Fallback
-            
-            # Weighted choice for type
-            weights = [st.session_state.ac_tag_ratios[t] for t in available_tags]
-            selected_type = random.choices(available_tags, weights=weights, k=1)[0]
-            
-            # Determine Split based on ratios
-            available_splits = [s for s, r in st.session_state.get('ac_split_ratios', {}).items() if r > 0]
-            if not available_splits: available_splits = ["sft_train"]
-            
-            split_weights = [st.session_state.ac_split_ratios[s] for s in available_splits]
-            selected_split = random.choices(available_splits, weights=split_weights, k=1)[0]
-
-            # Run Pipeline
-            # Note: pipeline.run_pipeline returns the mission dictionary directly
-            new_entry = pipeline.run_pipeline(
-                mission_type_str=selected_type,
-                dataset_split=selected_split
-            )
-            
-            # Post-process entry to match our view requirements
-            new_entry['name'] = m_name
-            # Ensure status is set based on validation
-            val_res = new_entry.get('validation_result', {})
-            if val_res.get('mission_is_valid'):
-                new_entry['status'] = 'success'
-            elif val_res.get('needs_human_review'):
-                 new_entry['status'] = 'verified_fail' # Or maybe review needed
-            else:
-                new_entry['status'] = 'failed'
-                
-            # If pipeline returned 'failed' id explicitly
-            if new_entry.get('id') == 'failed':
-                 new_entry['status'] = 'failed'
-            else:
-                 new_entry['id'] = f"gen_{int(time.time())}_{random.randint(1000,9999)}"
-
-        except Exception as e:
-            st.error(f"Pipeline Error: {e}")
-            new_entry = {
-                "id": f"err_{int(time.time())}",
-                "name": m_name,
-                "type": "error",
-                "status": "failed",
-                "instruction": f"Error during generation: {str(e)}",
-                "state_config": {},
-                "waypoints": []
-            }
-        
-        # Update state
-        st.session_state.gen_log.append(new_entry)
-        st.session_state.gen_processed_count += 1
-        st.rerun()
-        
-    elif processed >= total and st.session_state.is_generating:
+        # Show history, newest first; older entries only on request to bound widgets per rerun
+        gen_log = st.session_state.gen_log
+        recent_start = max(0, len(gen_log) - LOG_PAGE_SIZE)
+        for i in range(len(gen_log) - 1, recent_start - 1, -1):
+            render_log_item(i, gen_log[i])
+        if recent_start and st.toggle("Show full history", key="gen_show_full_log"):
+            with st.expander(f"Older missions ({recent_start})", expanded=True):
+                for i in range(recent_start - 1, -1, -1):
+                    render_log_item(i, gen_log[i])
+
+    # --- Completion ---
+    if processed >= total and st.session_state.is_generating:
         st.success("Generation Complete!")
         st.session_state.is_generating = False
         st.rerun()
@@ -272,13 +402,14 @@ def render_generation_progress():
                 if proj_name and data:
                     # Append new missions
                     current_len = len(data.get('missions', []))
-                    mission_types = load_mission_types()
                     
                     # Create project images directory
                     project_path = get_project_path(proj_name)
                     project_images_dir = os.path.join(project_path, "images")
                     os.makedirs(project_images_dir, exist_ok=True)
                     
+                    copy_jobs = []
+                    new_missions = []
                     for idx, m in enumerate(successful):
                         mission_id = f"mission_{current_len + idx + 1}"
                         
@@ -292,19 +423,15 @@ def render_generation_progress():
                                 new_media = {}
                                 for label, src_path in media_items.items():
                                     # Resolve absolute source path
-                                    if os.path.isabs(src_path):
-                                        abs_src = src_path
-                                    else:
-                                        abs_src = os.path.abspath(src_path)
-                                    
-                                    if os.path.exists(abs_src):
+                                    abs_src, found = resolve_media_path(src_path)
+                                    if found:
                                         # Create destination filename: mission_id_waypoint_id_label
                                         wp_id = wp.get('id', 'wp')
                                         dest_filename = f"{mission_id}_{wp_id}_{label}"
                                         dest_path = os.path.join(project_images_dir, dest_filename)
                                         
-                                        # Copy the image
-                                        shutil.copy2(abs_src, dest_path)
+                                        # Queue the copy; all images are copied together below
+                                        copy_jobs.append((abs_src, dest_path))
                                         
                                         # Store relative path for project
                                         new_media[label] = os.path.join("images", dest_filename)
@@ -316,16 +443,12 @@ def render_generation_progress():
                                 # Handle list format if needed
                                 new_media = []
                                 for src_path in media_items:
-                                    if os.path.isabs(src_path):
-                                        abs_src = src_path
-                                    else:
-                                        abs_src = os.path.abspath(src_path)
-                                    
-                                    if os.path.exists(abs_src):
+                                    abs_src, found = resolve_media_path(src_path)
+                                    if found:
                                         wp_id = wp.get('id', 'wp')
                                         dest_filename = f"{mission_id}_{wp_id}_{os.path.basename(src_path)}"
                                         dest_path = os.path.join(project_images_dir, dest_filename)
-                                        shutil.copy2(abs_src, dest_path)
+                                        copy_jobs.append((abs_src, dest_path))
                                         new_media.append(os.path.join("images", dest_filename))
                                     else:
                                         new_media.append(src_path)
@@ -334,7 +457,6 @@ def render_generation_progress():
                             processed_waypoints.append(processed_wp)
                         
                         # Construct proper mission object
-                        mt_config = mission_types.get(m['type'], {})
                         final_m = {
                             "id": mission_id,
                             "name": m['name'],
@@ -346,12 +468,23 @@ def render_generation_progress():
                             "mission_instruction": m.get('mission_instruction', m.get('instruction', '')), # Handle both keys
                             "instruction": m.get('mission_instruction', m.get('instruction', '')) # Keep redundant for now or standardize
                         }
-                        data['missions'].append(final_m)
+                        new_missions.append(final_m)
                     
-                    save_project_data(proj_name, data)
-                    st.success(f"Imported {len(successful)} missions!")
-                    time.sleep(1)
-                    navigate_to('project_overview')
+                    # Copy every image before touching the project, so it never points at missing files
+                    try:
+                        copy_files(copy_jobs)
+                    except OSError as e:
+                        st.error(f"Import aborted, copying the mission images failed: {e}")
+                    else:
+                        data['missions'].extend(new_missions)
+                        save_project_data(proj_name, data)
+                        # The run can't be imported twice: it isn't offered for restore again and this session forgets it
+                        mark_generation_run_imported(st.session_state.gen_run_id)
+                        for key in ('gen_total_missions', 'gen_processed_count', 'gen_log', 'gen_retry_queue', 'gen_run_id'):
+                            st.session_state.pop(key, None)
+                        # The toast outlives the page switch, so there's no need to pause first
+                        st.toast(f"Imported {len(successful)} missions!")
+                        navigate_to('project_overview')
         else:
             st.warning("No successful missions to import.")
             if st.button("Back"): navigate_to('agentic_creation')
@@ -3,6 +3,7 @@ from utils.data_utils import list_projects, create_project, load_project_data
 from utils.mission_types_manager import load_mission_types, save_mission_type, delete_mission_type
 from utils.ui_utils import navigate_to
 
+@st.fragment
 def render_home():
     st.title("🛸 UAV Mission Editor")
     c1, c2 = st.columns([3, 1])
@@ -46,6 +47,9 @@ def render_home():
         st.subheader("🎯 Mission Types")
         st.caption("Configure state machines for different mission types")
         
+        # Loaded once per render; used by the create form and the list below
+        mission_types = load_mission_types()
+        
         # Create new mission type
         with st.expander("➕ Create New Mission Type", expanded=False):
             new_name = st.text_input("Mission Type Name", key="new_mt_name", placeholder="e.g. search_and_rescue")
@@ -57,7 +61,6 @@ def render_home():
                     normalized_name = new_name.lower().replace(" ", "_").replace("-", "_")
                     
                     # Check if exists
-                    mission_types = load_mission_types()
                     if normalized_name in mission_types:
                         st.error(f"Mission type '{normalized_name}' already exists")
                     else:
@@ -87,8 +90,6 @@ def render_home():
                 else:
                     st.warning("Enter a name for the mission type")
         
-        mission_types = load_mission_types()
-        
         for m_type, details in mission_types.items():
             with st.container(border=True):
                 c1, c2, c3 = st.columns([3, 1, 1])
@@ -103,22 +104,17 @@ def render_home():
                 delete_key = f"delete_mt_{m_type}"
                 confirm_key = f"confirm_delete_{m_type}"
                 
-                if confirm_key in st.session_state and st.session_state[confirm_key]:
+                if st.session_state.get(confirm_key):
                     # Show confirmation buttons
                     if c3.button("⚠️ Confirm", key=f"confirm_btn_{m_type}", type="primary"):
                         delete_mission_type(m_type)
                         st.session_state[confirm_key] = False
                         st.toast(f"Deleted '{m_type}'")
                         st.rerun()
+                    if c3.button("❌ Cancel", key=f"cancel_{m_type}"):
+                        st.session_state[confirm_key] = False
+                        st.rerun()
                 else:
                     if c3.button("🗑️", key=delete_key, help="Delete this mission type"):
                         st.session_state[confirm_key] = True
                         st.rerun()
-        
-        # Cancel any pending delete confirmations
-        for m_type in mission_types.keys():
-            confirm_key = f"confirm_delete_{m_type}"
-            if confirm_key in st.session_state and st.session_state[confirm_key]:
-                if st.button(f"❌ Cancel delete of '{m_type}'", key=f"cancel_{m_type}"):
-                    st.session_state[confirm_key] = False
-                    st.rerun()
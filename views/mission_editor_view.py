@@ -1,41 +1,52 @@
 import streamlit as st
 import os
+import orjson
 import yaml
-from PIL import Image, ImageOps
+from functools import lru_cache
 from utils.data_utils import save_project_data, get_project_path
-from utils.mission_types_manager import load_mission_types, get_mission_type_names
-from utils.ui_utils import navigate_to, get_badge_html
+from utils.mission_types_manager import get_mission_type, get_mission_type_names, SafeDumper
+from utils.ui_utils import (
+    navigate_to, get_badge_html, load_thumbnail, load_preview, bake_thumbnail,
+    prefetch_thumbnails
+)
 
 
-def get_image_orientation(image_path: str) -> str:
-    """Determine if an image is portrait or landscape, accounting for EXIF rotation."""
+@lru_cache(maxsize=64)
+def _yaml_from_json(state_json: bytes) -> str:
+    return yaml.dump(orjson.loads(state_json), Dumper=SafeDumper, indent=2)
+
+
+def state_config_yaml(state: dict) -> str:
+    """YAML for the read-only state view; the pure-Python dump only reruns when the state changes."""
+    return _yaml_from_json(orjson.dumps(state, option=orjson.OPT_NON_STR_KEYS))
+
+
+@lru_cache(maxsize=16)
+def _scan_names(directory: str, mtime_ns: int) -> frozenset:
+    with os.scandir(directory) as entries:
+        return frozenset(e.name for e in entries)
+
+
+def list_dir_names(directory: str) -> frozenset:
+    """
+    File names in `directory`, re-scanned only when its mtime changes (an upload or
+    delete bumps it); one stat per call instead of one per media item.
+    """
     try:
-        with Image.open(image_path) as img:
-            # Apply EXIF orientation to get the true display dimensions
-            img_corrected = ImageOps.exif_transpose(img)
-            if img_corrected is None:
-                img_corrected = img
-            width, height = img_corrected.size
-            if height > width:
-                return "portrait"
-            else:
-                return "landscape"
-    except Exception:
-        return "landscape"  # Default to landscape if can't read
+        return _scan_names(directory, os.stat(directory).st_mtime_ns)
+    except FileNotFoundError:
+        return frozenset()
+
 
+# Grid thumbnails are shown at 100-180px; twice that keeps them sharp on HiDPI screens
+GRID_THUMB_SIDE = 360
 
 
 @st.dialog("Image Viewer", width="large")
 def show_image_dialog(image_path: str, image_name: str):
     """Display an image at full resolution in a dialog with EXIF correction."""
     try:
-        with Image.open(image_path) as img:
-            img_corrected = ImageOps.exif_transpose(img)
-            if img_corrected is None:
-                img_corrected = img.copy()
-            else:
-                img_corrected = img_corrected.copy()
-            st.image(img_corrected, use_container_width=True)
+        st.image(load_preview(image_path), use_container_width=True)
     except Exception:
         st.image(image_path, use_container_width=True)
     st.caption(f"📷 {image_name}")
@@ -43,6 +54,185 @@ def show_image_dialog(image_path: str, image_name: str):
         st.rerun()
 
 
+@st.fragment
+def render_waypoint(i: int, wp: dict, mission: dict, proj_name: str):
+    """One waypoint card; its own widgets rerun only this card."""
+    waypoints = mission['waypoints']
+    with st.container():
+        st.markdown(f'<div class="waypoint-card">', unsafe_allow_html=True)
+        
+        # Header
+        wc1, wc2, wc3 = st.columns([2, 1, 0.5])
+        wp['id'] = wc1.text_input("ID", value=wp.get('id', ''), key=f"wp_{i}_id")
+        
+        # Target Logic
+        def on_target_chg(idx):
+            for iw, w in enumerate(mission['waypoints']): 
+                if iw != idx:
+                    w['is_target'] = False
+                    st.session_state[f"wp_{iw}_t"] = False
+        
+        was_target = wp.get('is_target', False)
+        is_target = wc2.checkbox("Is Target", value=was_target, key=f"wp_{i}_t", on_change=on_target_chg, args=(i,))
+        wp['is_target'] = is_target
+        # Becoming the target clears the other cards' checkboxes, so they have to redraw too
+        if is_target and not was_target:
+            st.rerun()
+
+        if wc3.button("🗑️", key=f"wp_{i}_del"):
+            waypoints.pop(i)
+            st.rerun()
+
+        # Entities
+        with st.expander("Ground Truth Entities"):
+            # Rows are keyed by position, so renaming a key doesn't reset its own or later widgets
+            entities = list(wp.get('gt_entities', {}).items())
+            new_ent = []
+            removed = None
+            for ei, (k, v) in enumerate(entities):
+                ec1, ec2, ec3 = st.columns([1,1,0.2])
+                nk = ec1.text_input("Key", k, key=f"e_{i}_{ei}_k")
+                nv = ec2.text_input("Val", str(v), key=f"e_{i}_{ei}_v")
+                if ec3.button("x", key=f"e_{i}_{ei}_d"): removed = ei
+                new_ent.append((nk, nv))
+            if removed is not None:
+                new_ent.pop(removed)
+                wp['gt_entities'] = dict(new_ent)
+                # Later rows shift up a slot: drop their widget state so they re-read the dict
+                for ei in range(removed, len(entities)):
+                    st.session_state.pop(f"e_{i}_{ei}_k", None)
+                    st.session_state.pop(f"e_{i}_{ei}_v", None)
+                st.rerun()
+            if st.button("Add Entity", key=f"e_{i}_add"):
+                # Don't overwrite an entity that is already called "key"
+                taken = {k for k, _ in new_ent}
+                new_key = next(c for c in ("key", *(f"key_{n}" for n in range(2, len(taken) + 3))) if c not in taken)
+                new_ent.append((new_key, "val"))
+            wp['gt_entities'] = dict(new_ent)
+
+        # Media
+        st.write("**Media**")
+        uploader_key = f"upl_{i}_{len(wp.get('media', []))}"
+        uploaded = st.file_uploader("Upload", accept_multiple_files=True, key=uploader_key)
+        if uploaded:
+            images_dir = os.path.join(get_project_path(proj_name), "images")
+            os.makedirs(images_dir, exist_ok=True)
+            for f in uploaded:
+                # getbuffer() is a zero-copy view of the upload Streamlit already holds in memory
+                with open(os.path.join(images_dir, f.name), "wb") as bf: bf.write(f.getbuffer())
+                if f.name.endswith(('.png','.jpg','.jpeg')):
+                    # Bake the grid thumbnail now, decoding the in-memory upload rather than re-reading the file
+                    try:
+                        bake_thumbnail(os.path.join(images_dir, f.name), GRID_THUMB_SIDE, source=f)
+                    except Exception:
+                        pass  # The grid falls back to encoding from the original
+                rel_p = os.path.join("images", f.name)
+                if 'media' not in wp: wp['media'] = []
+                if rel_p not in wp['media']: wp['media'].append(rel_p)
+            st.rerun()
+
+
+
+        # Display Media (Handle both Dict and List formats)
+        media_items = wp.get('media', [])
+        if isinstance(media_items, dict):
+            # Convert dict {'filename': 'path'} to simple list of paths for display
+            # We lose the key (filename) in this simple view but it works for now
+            media_path_list = list(media_items.values())
+        else:
+            media_path_list = media_items
+
+        if media_path_list:
+            st.markdown('<div class="media-scroll">', unsafe_allow_html=True)
+            media_cols = st.columns(len(media_path_list))
+            project_path = get_project_path(proj_name)
+            images_dir = os.path.join(project_path, "images")
+            image_names = list_dir_names(images_dir)
+            for mi, m_path in enumerate(media_path_list):
+                fpath = os.path.join(project_path, m_path)
+                with media_cols[mi]:
+                    # Files directly under images/ are checked against one cached listing instead of a stat each
+                    if os.path.dirname(fpath) == images_dir:
+                        found = os.path.basename(fpath) in image_names
+                    else:
+                        found = os.path.exists(fpath)
+                    if found:
+                        if m_path.endswith(('.png','.jpg','.jpeg')):
+                            # EXIF-corrected thumbnail, cached on (path, mtime)
+                            try:
+                                thumb, width, height = load_thumbnail(fpath, GRID_THUMB_SIDE)
+                                
+                                # Determine orientation based on corrected dimensions
+                                if height > width:
+                                    orientation = "portrait"
+                                    display_width = 100
+                                else:
+                                    orientation = "landscape"
+                                    display_width = 180
+                                
+                                # Display corrected image
+                                st.image(thumb, width=display_width)
+                                st.caption(f"📷 {orientation.title()}")
+                            except Exception:
+                                st.image(fpath, width=150)
+                            
+                            # View full resolution button
+                            if st.button("🔍 View", key=f"view_m_{i}_{mi}"):
+                                show_image_dialog(fpath, os.path.basename(m_path))
+                        else: st.video(fpath)
+                        
+                        # Deletion logic (more complex with dicts, keeping simple for now)
+                        if st.button("❌", key=f"del_m_{i}_{mi}"):
+                            if isinstance(wp.get('media'), dict):
+                                # Find key by value
+                                key_to_del = next((k for k, v in wp['media'].items() if v == m_path), None)
+                                if key_to_del: del wp['media'][key_to_del]
+                            else:
+                                wp['media'].pop(mi)
+                            st.rerun()
+            st.markdown('</div>', unsafe_allow_html=True)
+
+        # Landmarks Display (Read-Only for now)
+        if 'landmarks' in wp and wp['landmarks']:
+            with st.expander(f"Landmarks ({len(wp['landmarks'])})"):
+                for li, landmark in enumerate(wp['landmarks']):
+                    cat = landmark.get('category', 'other')
+                    
+                    st.markdown(f"**{landmark.get('name', 'Unnamed Landmark')}**")
+                    
+                    # Display all attributes in a structured way
+                    attr_cols = st.columns([1, 3])
+                    
+                    # Category
+                    attr_cols[0].markdown("**Category:**")
+                    attr_cols[1].markdown(f"`{cat}`")
+                    
+                    # Visual Attributes
+                    if landmark.get('visual_attributes'):
+                        attr_cols = st.columns([1, 3])
+                        attr_cols[0].markdown("**Visual:**")
+                        attr_cols[1].markdown(landmark.get('visual_attributes'))
+                    
+                    # Text Content
+                    if landmark.get('text_content'):
+                        attr_cols = st.columns([1, 3])
+                        attr_cols[0].markdown("**Text:**")
+                        attr_cols[1].markdown(f"`{landmark.get('text_content')}`")
+                    
+                    # Position
+                    if landmark.get('position'):
+                        pos = landmark.get('position')
+                        attr_cols = st.columns([1, 3])
+                        attr_cols[0].markdown("**Position:**")
+                        attr_cols[1].markdown(f"x: `{pos[0]}`, y: `{pos[1]}`")
+                    
+                    # Divider between landmarks
+                    if li < len(wp['landmarks']) - 1:
+                        st.divider()
+        st.markdown('</div>', unsafe_allow_html=True)
+
+
+@st.fragment
 def render_mission_editor():
     proj_name = st.session_state.current_project
     data = st.session_state.project_data
@@ -57,18 +247,15 @@ def render_mission_editor():
     # Top Bar
     c1, c2, c3 = st.columns([0.5, 3, 1])
     if c1.button("⬅️ Back"): navigate_to('project_overview')
-    c2.markdown(f"### Editing: {mission.get('name')} {get_badge_html(mission.get('type', ''))}", unsafe_allow_html=True)
+    # Filled in after the config form, so an applied rename shows up in this same run
+    header = c2.empty()
     if c3.button("💾 Save"): 
         save_project_data(proj_name, data)
         st.toast("Saved!")
 
     # Mission Config
     with st.expander("Mission Configuration & State", expanded=True):
-        # Layout: Name (2) | Type (1) | Split (1)
-        c_meta_1, c_meta_2, c_meta_3 = st.columns([2, 1, 1])
-        mission['name'] = c_meta_1.text_input("Name", mission.get('name', ''))
-        
-        # Mission Type Switcher
+        # Mission Type Switcher (outside the form: switching types loads the new default_state immediately)
         available_types = get_mission_type_names()
         current_type = mission.get('type', available_types[0] if available_types else "")
         
@@ -76,10 +263,10 @@ def render_mission_editor():
             new_t = st.session_state.temp_mission_type
             mission['type'] = new_t
             # Reset state config to default for the new type
-            defaults = load_mission_types().get(new_t, {}).get('default_state', {})
+            defaults = get_mission_type(new_t).get('default_state', {})
             mission['state_config'] = defaults
             
-        c_meta_2.selectbox(
+        st.selectbox(
             "Mission Type", 
             available_types, 
             index=available_types.index(current_type) if current_type in available_types else 0,
@@ -87,35 +274,48 @@ def render_mission_editor():
             on_change=on_type_change
         )
         
-        # Dataset Split Selector
-        splits = ["sft_train", "rl_train", "validation"]
-        current_split = mission.get('dataset_split', 'sft_train')
-        if current_split not in splits: current_split = 'sft_train'
-        
-        mission['dataset_split'] = c_meta_3.selectbox(
-            "Dataset Split",
-            splits,
-            index=splits.index(current_split)
-        )
-        
-        # Instruction / Plan
-        st.markdown("**Mission Instruction / Plan**")
-        mission['instruction'] = st.text_area(
-            "Instructions for this specific mission",
-            value=mission.get('mission_instruction', mission.get('instruction', '')),
-            height=100,
-            label_visibility="collapsed"
-        )
-        # Sync simple `instruction` key for backward compat if needed
-        mission['mission_instruction'] = mission['instruction']
+        # Name, split and instruction only commit on Apply, so typing doesn't rerun the waypoints
+        with st.form("mission_cfg", clear_on_submit=False, border=False):
+            # Layout: Name (3) | Split (1)
+            c_meta_1, c_meta_2 = st.columns([3, 1])
+            new_name = c_meta_1.text_input("Name", mission.get('name', ''))
+            
+            # Dataset Split Selector
+            splits = ["sft_train", "rl_train", "validation"]
+            current_split = mission.get('dataset_split', 'sft_train')
+            if current_split not in splits: current_split = 'sft_train'
+            
+            new_split = c_meta_2.selectbox(
+                "Dataset Split",
+                splits,
+                index=splits.index(current_split)
+            )
+            
+            # Instruction / Plan
+            st.markdown("**Mission Instruction / Plan**")
+            new_instruction = st.text_area(
+                "Instructions for this specific mission",
+                value=mission.get('mission_instruction', mission.get('instruction', '')),
+                height=100,
+                label_visibility="collapsed"
+            )
+            
+            if st.form_submit_button("Apply"):
+                mission['name'] = new_name
+                mission['dataset_split'] = new_split
+                mission['instruction'] = new_instruction
+                # Sync simple `instruction` key for backward compat if needed
+                mission['mission_instruction'] = new_instruction
 
         
+        header.markdown(f"### Editing: {mission.get('name')} {get_badge_html(mission.get('type', ''))}", unsafe_allow_html=True)
+
         # Read-only State Configuration
         with st.expander("State Configuration (Read-Only)"):
             st.caption(f"derived from type: {mission.get('type')}")
             current_state = mission.get('state_config', {})
             try:
-                val = yaml.dump(current_state, indent=2)
+                val = state_config_yaml(current_state)
                 st.code(val, language='yaml')
             except: 
                  st.text(str(current_state))
@@ -132,150 +332,18 @@ def render_mission_editor():
 
     waypoints = mission.get('waypoints', [])
     
+    # Decode every waypoint's grid thumbnails up front in parallel; the cards below then hit the cache
+    project_path = get_project_path(proj_name)
+    prefetch_thumbnails([
+        os.path.join(project_path, m_path)
+        for wp in waypoints
+        for m_path in (wp.get('media', {}).values() if isinstance(wp.get('media'), dict) else wp.get('media', []))
+        if m_path.endswith(('.png','.jpg','.jpeg'))
+    ], GRID_THUMB_SIDE)
+
     # Waypoint Iteration
     for i, wp in enumerate(waypoints):
-        with st.container():
-            st.markdown(f'<div class="waypoint-card">', unsafe_allow_html=True)
-            
-            # Header
-            wc1, wc2, wc3 = st.columns([2, 1, 0.5])
-            wp['id'] = wc1.text_input("ID", value=wp.get('id', ''), key=f"wp_{i}_id")
-            
-            # Target Logic
-            def on_target_chg(idx):
-                for iw, w in enumerate(mission['waypoints']): 
-                    if iw != idx: w['is_target'] = False
-            
-            is_target = wc2.checkbox("Is Target", value=wp.get('is_target', False), key=f"wp_{i}_t", on_change=on_target_chg, args=(i,))
-            wp['is_target'] = is_target
-
-            if wc3.button("🗑️", key=f"wp_{i}_del"):
-                waypoints.pop(i)
-                st.rerun()
-
-            # Entities
-            with st.expander("Ground Truth Entities"):
-                entities = wp.get('gt_entities', {})
-                new_ent = {}
-                for k, v in entities.items():
-                    ec1, ec2, ec3 = st.columns([1,1,0.2])
-                    nk = ec1.text_input("Key", k, key=f"e_{i}_{k}_k")
-                    nv = ec2.text_input("Val", str(v), key=f"e_{i}_{k}_v")
-                    if not ec3.button("x", key=f"e_{i}_{k}_d"): new_ent[nk] = nv
-                if st.button("Add Entity", key=f"e_{i}_add"): new_ent["key"] = "val"
-                wp['gt_entities'] = new_ent
-
-            # Media
-            st.write("**Media**")
-            uploader_key = f"upl_{i}_{len(wp.get('media', []))}"
-            uploaded = st.file_uploader("Upload", accept_multiple_files=True, key=uploader_key)
-            if uploaded:
-                images_dir = os.path.join(get_project_path(proj_name), "images")
-                os.makedirs(images_dir, exist_ok=True)
-                for f in uploaded:
-                    with open(os.path.join(images_dir, f.name), "wb") as bf: bf.write(f.getbuffer())
-                    rel_p = os.path.join("images", f.name)
-                    if 'media' not in wp: wp['media'] = []
-                    if rel_p not in wp['media']: wp['media'].append(rel_p)
-                st.rerun()
-
-
-
-            # Display Media (Handle both Dict and List formats)
-            media_items = wp.get('media', [])
-            if isinstance(media_items, dict):
-                # Convert dict {'filename': 'path'} to simple list of paths for display
-                # We lose the key (filename) in this simple view but it works for now
-                media_path_list = list(media_items.values())
-            else:
-                media_path_list = media_items
-
-            if media_path_list:
-                st.markdown('<div class="media-scroll">', unsafe_allow_html=True)
-                media_cols = st.columns(len(media_path_list))
-                for mi, m_path in enumerate(media_path_list):
-                    fpath = os.path.join(get_project_path(proj_name), m_path)
-                    with media_cols[mi]:
-                        if os.path.exists(fpath):
-                            if m_path.endswith(('.png','.jpg','.jpeg')):
-                                # Load image and apply EXIF orientation correction
-                                try:
-                                    with Image.open(fpath) as img:
-                                        img_corrected = ImageOps.exif_transpose(img)
-                                        if img_corrected is None:
-                                            img_corrected = img.copy()
-                                        else:
-                                            img_corrected = img_corrected.copy()
-                                        width, height = img_corrected.size
-                                        
-                                        # Determine orientation based on corrected dimensions
-                                        if height > width:
-                                            orientation = "portrait"
-                                            display_width = 100
-                                        else:
-                                            orientation = "landscape"
-                                            display_width = 180
-                                        
-                                        # Display corrected image
-                                        st.image(img_corrected, width=display_width)
-                                        st.caption(f"📷 {orientation.title()}")
-                                except Exception:
-                                    st.image(fpath, width=150)
-                                
-                                # View full resolution button
-                                if st.button("🔍 View", key=f"view_m_{i}_{mi}"):
-                                    show_image_dialog(fpath, os.path.basename(m_path))
-                            else: st.video(fpath)
-                            
-                            # Deletion logic (more complex with dicts, keeping simple for now)
-                            if st.button("❌", key=f"del_m_{i}_{mi}"):
-                                if isinstance(wp.get('media'), dict):
-                                    # Find key by value
-                                    key_to_del = next((k for k, v in wp['media'].items() if v == m_path), None)
-                                    if key_to_del: del wp['media'][key_to_del]
-                                else:
-                                    wp['media'].pop(mi)
-                                st.rerun()
-                st.markdown('</div>', unsafe_allow_html=True)
-
-            # Landmarks Display (Read-Only for now)
-            if 'landmarks' in wp and wp['landmarks']:
-                with st.expander(f"Landmarks ({len(wp['landmarks'])})"):
-                    for li, landmark in enumerate(wp['landmarks']):
-                        cat = landmark.get('category', 'other')
-                        
-                        st.markdown(f"**{landmark.get('name', 'Unnamed Landmark')}**")
-                        
-                        # Display all attributes in a structured way
-                        attr_cols = st.columns([1, 3])
-                        
-                        # Category
-                        attr_cols[0].markdown("**Category:**")
-                        attr_cols[1].markdown(f"`{cat}`")
-                        
-                        # Visual Attributes
-                        if landmark.get('visual_attributes'):
-                            attr_cols = st.columns([1, 3])
-                            attr_cols[0].markdown("**Visual:**")
-                            attr_cols[1].markdown(landmark.get('visual_attributes'))
-                        
-                        # Text Content
-                        if landmark.get('text_content'):
-                            attr_cols = st.columns([1, 3])
-                            attr_cols[0].markdown("**Text:**")
-                            attr_cols[1].markdown(f"`{landmark.get('text_content')}`")
-                        
-                        # Position
-                        if landmark.get('position'):
-                            pos = landmark.get('position')
-                            attr_cols = st.columns([1, 3])
-                            attr_cols[0].markdown("**Position:**")
-                            attr_cols[1].markdown(f"x: `{pos[0]}`, y: `{pos[1]}`")
-                        
-                        # Divider between landmarks
-                        if li < len(wp['landmarks']) - 1:
-                            st.divider()
-            st.markdown('</div>', unsafe_allow_html=True)
+        render_waypoint(i, wp, mission, proj_name)
 
     if st.button("➕ Add Waypoint"):
         waypoints.append({"id": f"wp_{len(waypoints)+1}", "gt_entities": {}, "is_target": False, "media": []})
@@ -1,22 +1,31 @@
 import streamlit as st
 import yaml
-import json
-from utils.mission_types_manager import load_mission_types, save_mission_types
+import orjson
+from functools import lru_cache
+from utils.mission_types_manager import get_mission_type, save_mission_type, SafeLoader, SafeDumper
 from utils.ui_utils import navigate_to
 
+@lru_cache(maxsize=32)
+def state_text(state_json: bytes, fmt: str) -> str:
+    """Editor text for a default_state (given as JSON bytes); only re-dumped when the state changes."""
+    state = orjson.loads(state_json)
+    if fmt == "YAML":
+        return yaml.dump(state, Dumper=SafeDumper, indent=2, sort_keys=False)
+    return orjson.dumps(state, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+
+@st.fragment
 def render_mission_type_editor():
     m_type = st.session_state.editing_mission_type
     if not m_type:
         navigate_to('settings')
         return
 
-    mission_types = load_mission_types()
-    if m_type not in mission_types:
+    # Only this type is copied and, on save, rewritten; the other type files are left alone
+    details = get_mission_type(m_type)
+    if not details:
         st.error("Mission type not found")
         if st.button("Back"): navigate_to('settings')
         return
-
-    details = mission_types[m_type]
     
     st.title(f"🛠️ Edit: {m_type.replace('_', ' ').title()}")
     col1, col2, col3 = st.columns([1, 1, 3])
@@ -36,7 +45,7 @@ def render_mission_type_editor():
     
     if edit_mode == "YAML":
         try:
-            yaml_str = yaml.dump(current_state, indent=2, sort_keys=False)
+            yaml_str = state_text(orjson.dumps(current_state, option=orjson.OPT_NON_STR_KEYS), "YAML")
         except Exception as e:
             yaml_str = "# Error converting to YAML\n" + str(e)
             
@@ -44,24 +53,20 @@ def render_mission_type_editor():
         
         if st.button("💾 Save Changes", type="primary"):
             try:
-                new_state = yaml.safe_load(new_yaml_str)
-                updated_types = mission_types.copy()
-                updated_types[m_type] = {"description": new_desc, "default_state": new_state}
-                save_mission_types(updated_types)
+                new_state = yaml.load(new_yaml_str, Loader=SafeLoader)
+                save_mission_type(m_type, {"description": new_desc, "default_state": new_state})
                 st.success("Configuration saved successfully!")
             except yaml.YAMLError as e:
                 st.error(f"Invalid YAML: {e}")
                 
     else: # JSON
-        json_str = json.dumps(current_state, indent=4)
+        json_str = state_text(orjson.dumps(current_state, option=orjson.OPT_NON_STR_KEYS), "JSON")
         new_json_str = st.text_area("JSON Configuration", value=json_str, height=600)
         
         if st.button("💾 Save Changes", type="primary"):
             try:
-                new_state = json.loads(new_json_str)
-                updated_types = mission_types.copy()
-                updated_types[m_type] = {"description": new_desc, "default_state": new_state}
-                save_mission_types(updated_types)
+                new_state = orjson.loads(new_json_str)
+                save_mission_type(m_type, {"description": new_desc, "default_state": new_state})
                 st.success("Configuration saved successfully!")
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 st.error(f"Invalid JSON: {e}")
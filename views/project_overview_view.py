@@ -1,8 +1,8 @@
 import streamlit as st
+import html
 import os
-import time
 from utils.data_utils import save_project_data, get_project_path, get_exports_dir, filter_missions, prepare_missions_for_export
-from utils.mission_types_manager import load_mission_types, get_mission_type_names
+from utils.mission_types_manager import get_mission_type, get_mission_type_names
 from utils.ui_utils import navigate_to, get_badge_html, get_split_badge_html, get_source_badge_html
 from utils.hf_utils import (
     export_missions_to_hf_dataset, 
@@ -12,6 +12,18 @@ from utils.hf_utils import (
 )
 from utils.config_manager import load_config
 
+# How long a dataset check is reused before the Hub is asked again
+HF_CHECK_TTL_SECONDS = 60
+
+# Mission cards rendered per page of the overview list
+MISSIONS_PAGE_SIZE = 50
+
+
+@st.cache_data(ttl=HF_CHECK_TTL_SECONDS, show_spinner=False)
+def check_hf_dataset(repo_id, token):
+    """load_hf_dataset_metadata memoized per (repo, token); cache_data keys on a hash, so the token isn't kept."""
+    return load_hf_dataset_metadata(repo_id=repo_id, token=token)
+
 
 @st.dialog("Export Dataset", width="large")
 def export_dialog(missions, project_name):
@@ -87,7 +99,8 @@ def export_dialog(missions, project_name):
                         output_dir=exports_dir,
                         dataset_name=dataset_name
                     )
-                    st.success(f"✅ Dataset exported locally to: `{dataset_path}`")
+                    # Toasts outlive the rerun that closes the dialog, so there's no need to pause first
+                    st.toast(f"✅ Dataset exported locally to: `{dataset_path}`")
                 
                 # Upload to HuggingFace
                 if upload_to_hf:
@@ -122,9 +135,8 @@ def export_dialog(missions, project_name):
                             private=hf_private
                         )
                     
-                    st.success(f"✅ Dataset uploaded to: [{hf_repo_id}]({url})")
+                    st.toast(f"✅ Dataset uploaded to: [{hf_repo_id}]({url})")
                 
-                time.sleep(1)
                 st.rerun()
                 
             except Exception as e:
@@ -166,10 +178,7 @@ def import_dialog(project_name, data):
             return
         
         with st.spinner("Validating dataset format..."):
-            is_valid, message, count = load_hf_dataset_metadata(
-                repo_id=hf_repo_id,
-                token=hf_token if hf_token else None
-            )
+            is_valid, message, count = check_hf_dataset(hf_repo_id, hf_token if hf_token else None)
             st.session_state.import_validation_result = (is_valid, message, count)
             st.session_state.import_repo_checked = hf_repo_id
     
@@ -198,19 +207,19 @@ def import_dialog(project_name, data):
                         if success:
                             # Add imported missions to project
                             existing_count = len(data.get('missions', []))
-                            for i, m in enumerate(imported_missions):
-                                m['id'] = f"mission_{existing_count + i + 1}"
+                            for i, m in enumerate(imported_missions, start=existing_count + 1):
+                                m['id'] = f"mission_{i}"
                                 m['creation_source'] = 'imported'
-                                data['missions'].append(m)
+                            data['missions'].extend(imported_missions)
                             
                             save_project_data(project_name, data)
-                            st.success(f"✅ {msg}")
+                            # Shown after the rerun that closes the dialog
+                            st.toast(f"✅ {msg}")
                             
                             # Clear validation state
                             st.session_state.import_validation_result = None
                             st.session_state.import_repo_checked = None
                             
-                            time.sleep(1)
                             st.rerun()
                         else:
                             st.error(f"Import failed: {msg}")
@@ -231,6 +240,26 @@ def import_dialog(project_name, data):
             """)
 
 
+def mission_row_html(m) -> str:
+    """Name, badges and instruction of an overview row as one HTML grid, so each row is a single markdown element."""
+    inst = m.get('instruction', '')
+    # Truncate and single line
+    display_inst = ((inst[:50] + '...') if len(inst) > 50 else inst).replace('\n', ' ')
+    return (
+        f'<div class="mission-row">'
+        f'<span><b>{html.escape(m.get("name", "Untitled"))}</b> {get_source_badge_html(m.get("creation_source", "manual"))}</span>'
+        f'<span>{get_badge_html(m.get("type", "unknown"))}</span>'
+        f'<span>{get_split_badge_html(m.get("dataset_split", "sft_train"))}</span>'
+        f'<span class="mission-instruction">{html.escape(display_inst)}</span>'
+        f'</div>'
+    )
+
+def delete_mission(proj_name, data, index):
+    """Delete-button callback: runs before the fragment rerun, so the list and counts render without the mission."""
+    data['missions'].pop(index)
+    save_project_data(proj_name, data)
+
+@st.fragment
 def render_project_overview():
     proj_name = st.session_state.current_project
     data = st.session_state.project_data
@@ -254,22 +283,25 @@ def render_project_overview():
     # Filtering
     # Vertical stacking as requested
     available_tags = get_mission_type_names()
-    selected_tags = st.multiselect("Filter by Type", available_tags, default=available_tags)
-    
     available_splits = ["sft_train", "rl_train", "validation"]
-    selected_splits = st.multiselect("Filter by Split", available_splits, default=available_splits)
-
     available_sources = ["manual", "synthetic", "imported"]
-    selected_sources = st.multiselect("Filter by Source", available_sources, default=available_sources)
+    # Changes to the three filters are applied together, in one rerun
+    with st.form("filter_form", border=False):
+        selected_tags = st.multiselect("Filter by Type", available_tags, default=available_tags)
+        selected_splits = st.multiselect("Filter by Split", available_splits, default=available_splits)
+        selected_sources = st.multiselect("Filter by Source", available_sources, default=available_sources)
+        st.form_submit_button("Apply Filters")
 
     # Mission List
     missions = data.get('missions', [])
     
+    # Set membership instead of scanning the selected lists once per mission
+    tag_set, split_set, source_set = frozenset(selected_tags), frozenset(selected_splits), frozenset(selected_sources)
     filtered_missions = [
         (i, m) for i, m in enumerate(missions) 
-        if m.get('type', 'locate_and_report') in selected_tags
-        and m.get('dataset_split', 'sft_train') in selected_splits
-        and m.get('creation_source', 'manual') in selected_sources
+        if m.get('type', 'locate_and_report') in tag_set
+        and m.get('dataset_split', 'sft_train') in split_set
+        and m.get('creation_source', 'manual') in source_set
     ]
 
     # Export/Import Section
@@ -305,7 +337,7 @@ def render_project_overview():
             
             if st.form_submit_button("Create & Edit"):
                 # Get default state for this type
-                mt_config = load_mission_types().get(nm_type, {})
+                mt_config = get_mission_type(nm_type)
                 new_m = {
                     "id": f"mission_{len(missions)+1}",
                     "name": nm_name,
@@ -325,27 +357,24 @@ def render_project_overview():
     if not filtered_missions:
         st.info("No missions found matching filter.")
     else:
-        for original_idx, m in filtered_missions:
+        # Only one page of cards is built per rerun, however large the project
+        page_count = -(-len(filtered_missions) // MISSIONS_PAGE_SIZE)
+        page = 1
+        if page_count > 1:
+            pg_col, info_col = st.columns([1, 4])
+            page = pg_col.number_input("Page", min_value=1, max_value=page_count, value=1, step=1)
+        page_start = (page - 1) * MISSIONS_PAGE_SIZE
+        page_missions = filtered_missions[page_start:page_start + MISSIONS_PAGE_SIZE]
+        if page_count > 1:
+            info_col.caption(f"Showing {page_start + 1}–{page_start + len(page_missions)} of {len(filtered_missions)}")
+        for original_idx, m in page_missions:
             # Custom Card Layout using Container
             with st.container(border=True):
-                # Layout: [Name (1.5)] [Tag (1.5)] [Split(1)] [Instruction (3)] [Edit (0.5)] [Delete (0.5)]
-                c1, c2, c3, c4, c5, c6 = st.columns([1.5, 1.5, 1, 3, 0.5, 0.5])
+                # Layout: [Name | Tag | Split | Instruction (7)] [Edit (0.5)] [Delete (0.5)]
+                c1, c5, c6 = st.columns([7, 0.5, 0.5])
                 
                 with c1:
-                    st.markdown(f"**{m.get('name', 'Untitled')}** {get_source_badge_html(m.get('creation_source', 'manual'))}", unsafe_allow_html=True)
-                
-                with c2:
-                    st.markdown(get_badge_html(m.get('type', 'unknown')), unsafe_allow_html=True)
-
-                with c3:
-                    st.markdown(get_split_badge_html(m.get('dataset_split', 'sft_train')), unsafe_allow_html=True)
-                
-                with c4:
-                    inst = m.get('instruction', '')
-                    if inst:
-                        # Truncate and single line
-                        display_inst = (inst[:50] + '...') if len(inst) > 50 else inst
-                        st.caption(display_inst.replace('\n', ' '))
+                    st.markdown(mission_row_html(m), unsafe_allow_html=True)
                 
                 with c5:
                     if st.button("✏️", key=f"edit_m_{original_idx}", help="Edit Mission"):
@@ -353,7 +382,5 @@ def render_project_overview():
                         navigate_to('mission_editor')
                 
                 with c6:
-                    if st.button("🗑️", key=f"del_m_{original_idx}", help="Delete Mission"):
-                        missions.pop(original_idx)
-                        save_project_data(proj_name, data)
-                        st.rerun()
+                    st.button("🗑️", key=f"del_m_{original_idx}", help="Delete Mission",
+                              on_click=delete_mission, args=(proj_name, data, original_idx))
@@ -1,8 +1,34 @@
 import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
 from utils.config_manager import load_config, save_config
 from utils.hf_utils import sync_from_hf, sync_to_hf
 from utils.ui_utils import navigate_to
 
+# How often the sync status line checks on a running pull/push
+SYNC_POLL_SECONDS = 1
+
+# Pulls and pushes run here, so the page stays usable while files transfer
+_SYNC_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="hf_sync")
+
+@st.fragment(run_every=SYNC_POLL_SECONDS)
+def render_sync_status():
+    """Shows the running sync; once it finishes, reports the outcome and reruns the page to re-enable the buttons."""
+    job = st.session_state.get("sync_job")
+    if job is None:
+        return
+    label, future = job
+    if not future.done():
+        st.info(f"⏳ {label}...")
+        return
+    del st.session_state["sync_job"]
+    try:
+        future.result()
+        st.toast(f"✅ {label} finished")
+    except Exception as e:
+        st.toast(f"❌ {label} failed: {e}")
+    st.rerun(scope="app")
+
+@st.fragment
 def render_settings():
     st.title("⚙️ Settings")
     
@@ -20,17 +46,21 @@ def render_settings():
     with tabs[1]:
         config = load_config()
         repo_id = st.text_input("Repository ID", placeholder="username/dataset-name")
+        busy = "sync_job" in st.session_state
         c1, c2 = st.columns(2)
-        if c1.button("⬇️ Pull Project"):
+        if c1.button("⬇️ Pull Project", disabled=busy):
             if repo_id and config.get('hf_token'):
-                with st.spinner("Pulling..."):
-                    sync_from_hf(repo_id, "projects", token=config.get("hf_token"))
-                    st.success("Synced!")
-        if c2.button("⬆️ Push Project"):
+                future = _SYNC_POOL.submit(sync_from_hf, repo_id, "projects", token=config.get("hf_token"))
+                st.session_state.sync_job = (f"Pulling {repo_id}", future)
+                # Render again so both buttons show as disabled while the transfer runs
+                st.rerun()
+        if c2.button("⬆️ Push Project", disabled=busy):
             if repo_id and config.get('hf_token'):
-                with st.spinner("Pushing..."):
-                    sync_to_hf(repo_id, "projects", token=config.get("hf_token"))
-                    st.success("Pushed!")
+                future = _SYNC_POOL.submit(sync_to_hf, repo_id, "projects", token=config.get("hf_token"))
+                st.session_state.sync_job = (f"Pushing {repo_id}", future)
+                st.rerun()
+        if "sync_job" in st.session_state:
+            render_sync_status()
 
     st.divider()
     if st.button("⬅️ Back"): navigate_to('home')
@@ -1,9 +1,7 @@
+import copy
 import streamlit as st
-from streamlit_flow import streamlit_flow
-from streamlit_flow.elements import StreamlitFlowNode, StreamlitFlowEdge
-from streamlit_flow.state import StreamlitFlowState
-from streamlit_flow.layouts import ManualLayout
-from utils.mission_types_manager import load_mission_types, save_mission_type
+from collections import defaultdict
+from utils.mission_types_manager import get_mission_type, save_mission_type
 from utils.ui_utils import navigate_to
 
 # =============================================================================
@@ -19,6 +17,42 @@ STATE_COLORS = {
     'undefined': {'bg': '#616161', 'border': '#424242', 'text': '#ffffff'}
 }
 
+# Emoji prefix of each node kind's label
+STATE_LABEL_PREFIX = {'initial': '🚀 ', 'normal': '📦 ', 'end': '🏁 ', 'error': '⚠️ ', 'undefined': '❓ '}
+
+# Node and edge styles, built once; every graph rebuild hands out these same dicts
+NODE_STYLES = {
+    kind: {
+        'background': colors['bg'],
+        'color': colors['text'],
+        'border': f"3px solid {colors['border']}",
+        'borderRadius': '10px',
+        'padding': '12px',
+        'width': '180px',
+        'fontWeight': 'bold',
+        'boxShadow': '0 4px 8px rgba(0,0,0,0.3)'
+    }
+    for kind, colors in STATE_COLORS.items()
+}
+# Dashed outline for states that are referenced but not defined
+UNDEFINED_NODE_STYLES = {
+    kind: {
+        'background': colors['bg'],
+        'color': colors['text'],
+        'border': f"2px dashed {colors['border']}",
+        'borderRadius': '10px',
+        'padding': '10px',
+        'fontWeight': 'bold'
+    }
+    for kind, colors in STATE_COLORS.items()
+}
+EDGE_LABEL_STYLE = {'fill': '#ffffff', 'fontSize': '11px', 'fontWeight': 'bold'}
+EDGE_MARKER_END = {'type': 'arrowclosed'}
+TRANSITION_EDGE_STYLE = {'stroke': '#64b5f6', 'strokeWidth': 2}
+TRANSITION_LABEL_BG_STYLE = {'fill': '#1e1e1e', 'fillOpacity': 0.85, 'rx': 4, 'ry': 4}
+ERROR_EDGE_STYLE = {'stroke': '#ef5350', 'strokeDasharray': '5,5', 'strokeWidth': 2}
+ERROR_LABEL_BG_STYLE = {'fill': '#c62828', 'fillOpacity': 0.9, 'rx': 4, 'ry': 4}
+
 # Transition condition templates
 CONDITION_TEMPLATES = [
     {"label": "Always True", "template": "True"},
@@ -30,6 +64,8 @@ CONDITION_TEMPLATES = [
     {"label": "Past Locations > N", "template": "len({past_locations}) > {value}"},
     {"label": "Custom Condition", "template": ""},
 ]
+CONDITION_TEMPLATE_LABELS = [t["label"] for t in CONDITION_TEMPLATES]
+CONDITION_TEMPLATES_BY_LABEL = {t["label"]: t["template"] for t in CONDITION_TEMPLATES}
 
 
 def get_available_tools_and_observations():
@@ -80,6 +116,10 @@ def reset_flow_state(m_type):
 
 
 def render_visual_state_editor():
+    # streamlit_flow is only imported once this page is opened, not at app startup
+    from streamlit_flow import streamlit_flow
+    from streamlit_flow.state import StreamlitFlowState
+    from streamlit_flow.layouts import ManualLayout
     m_type = st.session_state.get('editing_mission_type')
     if not m_type:
         st.warning("No mission type selected for editing.")
@@ -87,14 +127,20 @@ def render_visual_state_editor():
             navigate_to('home')
         return
 
-    mission_types = load_mission_types()
-    if m_type not in mission_types:
+    # A private copy of just this type; the editor mutates it in place
+    details = get_mission_type(m_type)
+    if not details:
         st.error(f"Mission type '{m_type}' not found.")
         if st.button("🏠 Main Menu"):
             navigate_to('home')
         return
-
-    details = mission_types[m_type]
+    
+    # Node positions are editor-only (save_mission_type strips ui_metadata), so they live in session state;
+    # the handlers and the sidebar fragment edit details["ui_metadata"]["positions"], which is this same dict.
+    # It is only ever updated in place, so the `details` a fragment rerun still holds sees the latest positions
+    positions_key = f"flow_positions_{m_type}"
+    positions = st.session_state.setdefault(positions_key, details.get("ui_metadata", {}).get("positions", {}))
+    details["ui_metadata"] = {"positions": positions}
     
     # Ensure default_state and states are dictionaries
     if not isinstance(details.get("default_state"), dict):
@@ -170,38 +216,48 @@ def render_visual_state_editor():
         st.session_state.skip_sync_once = False
 
     if changes_made:
+        # The handlers only edit `details`; one write covers everything they changed this rerun
+        save_mission_type(m_type, details, prefer_yaml=True)
         reset_flow_state(m_type)
         st.rerun()
 
-    # Sidebar Editor
-    render_sidebar_editor(selected_id, states, config, details, m_type, flow_state_key, edges, new_state, initial_state)
+    # Remember dragged positions for the sidebar and the next graph rebuild; nothing goes to disk
+    dragged = {node.id: [node.position['x'], node.position['y']] for node in new_state.nodes}
+    positions.clear()
+    positions.update(dragged)
+
+    # Sidebar Editor (a fragment can't open st.sidebar itself, so it is entered here)
+    with st.sidebar:
+        render_sidebar_editor(selected_id, states, config, details, m_type, flow_state_key, edges, new_state, initial_state)
 
     # Update session state
     if not skipping_sync:
         st.session_state[flow_state_key] = new_state
 
-    # Save positions if they changed
-    new_positions = {node.id: [node.position['x'], node.position['y']] for node in new_state.nodes}
-    if new_positions != ui_metadata.get("positions"):
-        details.setdefault("ui_metadata", {})["positions"] = new_positions
-        save_mission_type(m_type, details, prefer_yaml=True)
-
 
 # =============================================================================
 # GRAPH BUILDING
 # =============================================================================
 
+def truncate_label(text: str, limit: int) -> str:
+    """`text` cut to at most `limit` characters, ending in "..." when shortened."""
+    return text if len(text) <= limit else text[:limit - 3] + "..."
+
+
 def build_graph_elements(states, initial_state, ui_metadata=None):
     """Convert YAML state config to graph nodes and edges with high-contrast styling."""
+    from streamlit_flow.elements import StreamlitFlowNode, StreamlitFlowEdge
     nodes = []
     edges = []
-    state_names = sorted(list(states.keys()))
+    state_names = sorted(states)
     
     ui_metadata = ui_metadata or {}
     positions = ui_metadata.get("positions", {})
     
     cols = 2
     x_spacing, y_spacing = 300, 200
+    # Transition targets, gathered while walking the states for edges
+    referenced = set()
     
     for i, state_name in enumerate(state_names):
         state_data = states[state_name]
@@ -212,21 +268,9 @@ def build_graph_elements(states, initial_state, ui_metadata=None):
             }
         
         # Determine state type and colors
-        is_initial = state_name == initial_state
-        state_type = get_state_type(state_name, state_data)
-        
-        if is_initial:
-            colors = STATE_COLORS['initial']
-            label = f"🚀 {state_name}"
-        elif state_type == 'end':
-            colors = STATE_COLORS['end']
-            label = f"🏁 {state_name}"
-        elif state_type == 'error':
-            colors = STATE_COLORS['error']
-            label = f"⚠️ {state_name}"
-        else:
-            colors = STATE_COLORS['normal']
-            label = f"📦 {state_name}"
+        kind = 'initial' if state_name == initial_state else get_state_type(state_name, state_data)
+        style = NODE_STYLES[kind]
+        label = STATE_LABEL_PREFIX[kind] + state_name
 
         # Position
         if state_name in positions:
@@ -250,53 +294,37 @@ def build_graph_elements(states, initial_state, ui_metadata=None):
             draggable=True,
             connectable=True,
             deletable=True,
-            style={
-                'background': colors['bg'],
-                'color': colors['text'],
-                'border': f"3px solid {colors['border']}",
-                'borderRadius': '10px',
-                'padding': '12px',
-                'width': '180px',
-                'fontWeight': 'bold',
-                'boxShadow': '0 4px 8px rgba(0,0,0,0.3)'
-            }
+            style=style
         ))
 
         # Create edges for transitions - group by target to show as single edge
         trans = state_data.get("state_transitions", {})
         conditions = trans.get("conditions", [])
         
-        # Group transitions by target
-        target_conditions = {}  # target -> [(idx, condition), ...]
+        # Group transitions by target; indices are kept as strings, ready for the edge id
+        target_indices = defaultdict(list)  # target -> ["0", "2", ...]
+        target_conds = defaultdict(list)  # target -> [condition, ...]
         for j, cond_data in enumerate(conditions):
             nxt = cond_data.get("next_state")
             if nxt:
-                cond = cond_data.get("condition", "True")
-                if nxt not in target_conditions:
-                    target_conditions[nxt] = []
-                target_conditions[nxt].append((j, cond))
+                referenced.add(nxt)
+                target_indices[nxt].append(str(j))
+                target_conds[nxt].append(cond_data.get("condition", "True"))
         
         # Create one edge per target with combined label
-        for nxt, cond_list in target_conditions.items():
+        for nxt, cond_list in target_conds.items():
             # Build combined label showing all conditions
             if len(cond_list) == 1:
-                # Single condition - show as before
-                display_label = cond_list[0][1]
-                if len(display_label) > 30:
-                    display_label = display_label[:27] + "..."
+                display_label = truncate_label(cond_list[0], 30)
+            # Multiple conditions - joined with separators, or just the count if that would be too long;
+            # the joined length is known from the (truncated) lengths, so it is only built when shown
+            elif sum(min(len(c), 25) for c in cond_list) + 3 * (len(cond_list) - 1) > 50:
+                display_label = f"{len(cond_list)} conditions"
             else:
-                # Multiple conditions - combine with newlines/separators
-                labels = []
-                for idx, cond in cond_list:
-                    short_cond = cond if len(cond) < 25 else cond[:22] + "..."
-                    labels.append(short_cond)
-                display_label = " | ".join(labels)
-                # If too long, show count
-                if len(display_label) > 50:
-                    display_label = f"{len(cond_list)} conditions"
+                display_label = " | ".join(truncate_label(c, 25) for c in cond_list)
             
             # Edge ID encodes all condition indices for editing
-            indices_str = ",".join(str(idx) for idx, _ in cond_list)
+            indices_str = ",".join(target_indices[nxt])
             edge_id = f"{state_name}|{nxt}|{indices_str}"
             
             edges.append(StreamlitFlowEdge(
@@ -306,54 +334,42 @@ def build_graph_elements(states, initial_state, ui_metadata=None):
                 label=display_label,
                 animated=False,
                 edge_type='smoothstep',
-                marker_end={'type': 'arrowclosed'},
-                style={'stroke': '#64b5f6', 'strokeWidth': 2},
-                label_style={'fill': '#ffffff', 'fontSize': '11px', 'fontWeight': 'bold'},
+                marker_end=EDGE_MARKER_END,
+                style=TRANSITION_EDGE_STYLE,
+                label_style=EDGE_LABEL_STYLE,
                 label_show_bg=True,
-                label_bg_style={'fill': '#1e1e1e', 'fillOpacity': 0.85, 'rx': 4, 'ry': 4},
+                label_bg_style=TRANSITION_LABEL_BG_STYLE,
                 deletable=True
             ))
 
         
         # Error transition
-        err = trans.get("error", {})
-        if err.get("next_state"):
+        err = trans.get("error")
+        err_target = err.get("next_state") if err else None
+        if err_target:
+            referenced.add(err_target)
             edges.append(StreamlitFlowEdge(
-                id=f"{state_name}|{err.get('next_state')}|error",
+                id=f"{state_name}|{err_target}|error",
                 source=state_name,
-                target=err.get("next_state"),
+                target=err_target,
                 label="⚠️ error",
-                style={'stroke': '#ef5350', 'strokeDasharray': '5,5', 'strokeWidth': 2},
-                label_style={'fill': '#ffffff', 'fontSize': '11px', 'fontWeight': 'bold'},
+                style=ERROR_EDGE_STYLE,
+                label_style=EDGE_LABEL_STYLE,
                 label_show_bg=True,
-                label_bg_style={'fill': '#c62828', 'fillOpacity': 0.9, 'rx': 4, 'ry': 4},
+                label_bg_style=ERROR_LABEL_BG_STYLE,
                 edge_type='smoothstep',
-                marker_end={'type': 'arrowclosed'},
+                marker_end=EDGE_MARKER_END,
                 deletable=True
             ))
 
     # Add referenced but undefined states (like 'end', 'error')
-    referenced = set()
-    for s_data in states.values():
-        if s_data:
-            t = s_data.get("state_transitions", {})
-            for c in t.get("conditions", []):
-                if c.get("next_state"):
-                    referenced.add(c.get("next_state"))
-            if t.get("error", {}).get("next_state"):
-                referenced.add(t.get("error", {}).get("next_state"))
-    
+    # Set lookup instead of scanning every node for each referenced state
+    node_ids = {n.id for n in nodes}
     for ref in referenced:
-        if ref and ref not in states and not any(n.id == ref for n in nodes):
-            if ref == 'end':
-                colors = STATE_COLORS['end']
-                label = '🏁 end'
-            elif ref == 'error':
-                colors = STATE_COLORS['error']
-                label = '⚠️ error'
-            else:
-                colors = STATE_COLORS['undefined']
-                label = f"❓ {ref}"
+        if ref and ref not in states and ref not in node_ids:
+            kind = ref if ref in ('end', 'error') else 'undefined'
+            style = UNDEFINED_NODE_STYLES[kind]
+            label = STATE_LABEL_PREFIX[kind] + ref
             
             if ref in positions:
                 pos = tuple(positions[ref])
@@ -366,14 +382,7 @@ def build_graph_elements(states, initial_state, ui_metadata=None):
                 data={'label': label}, node_type='default',
                 source_position='bottom', target_position='top',
                 connectable=True, deletable=False,
-                style={
-                    'background': colors['bg'],
-                    'color': colors['text'],
-                    'border': f"2px dashed {colors['border']}",
-                    'borderRadius': '10px',
-                    'padding': '10px',
-                    'fontWeight': 'bold'
-                }
+                style=style
             ))
 
     return nodes, edges
@@ -383,42 +392,44 @@ def build_graph_elements(states, initial_state, ui_metadata=None):
 # SIDEBAR EDITOR
 # =============================================================================
 
+@st.fragment
 def render_sidebar_editor(selected_id, states, config, details, m_type, flow_state_key, edges, new_state, initial_state):
-    """Render the improved sidebar editor for states and transitions."""
+    """
+    Render the improved sidebar editor for states and transitions.
+    Runs as a fragment so its widgets don't rebuild the graph; every edit that changes the graph
+    ends in a full st.rerun().
+    """
     
     env_data = get_available_tools_and_observations()
     available_tools = env_data['tools']
     available_observations = env_data['observations']
     
-    with st.sidebar:
-        st.header("🛸 Editor Panel")
-        
-        # State Editor
-        if selected_id and selected_id in states:
-            render_state_editor(
-                selected_id, states, config, details, m_type, 
-                flow_state_key, available_tools, available_observations, initial_state
-            )
-        
-        # Edge selected
-        elif selected_id and "|" in selected_id:
-            render_edge_editor(selected_id, states, details, m_type, flow_state_key)
-        
-        else:
-            st.info("👆 Click a state or transition to edit")
+    st.header("🛸 Editor Panel")
+    
+    # State Editor
+    if selected_id and selected_id in states:
+        render_state_editor(
+            selected_id, states, config, details, m_type, 
+            flow_state_key, available_tools, available_observations, initial_state
+        )
+    
+    # Edge selected
+    elif selected_id and "|" in selected_id:
+        render_edge_editor(selected_id, states, details, m_type, flow_state_key)
+    
+    else:
+        st.info("👆 Click a state or transition to edit")
 
-        st.divider()
-        
-        # Reset Layout Button
-        if st.button("🔄 Reset Layout", use_container_width=True):
-            if "ui_metadata" in details:
-                del details["ui_metadata"]
-                save_mission_type(m_type, details, prefer_yaml=True)
-            reset_flow_state(m_type)
-            st.rerun()
+    st.divider()
+    
+    # Reset Layout Button
+    if st.button("🔄 Reset Layout", use_container_width=True):
+        st.session_state.pop(f"flow_positions_{m_type}", None)
+        reset_flow_state(m_type)
+        st.rerun()
 
-        # Create New State Section
-        render_create_state_panel(states, config, details, m_type, flow_state_key, selected_id, available_tools, available_observations)
+    # Create New State Section
+    render_create_state_panel(states, config, details, m_type, flow_state_key, selected_id, available_tools, available_observations)
 
 
 def render_state_editor(selected_id, states, config, details, m_type, flow_state_key, available_tools, available_observations, initial_state):
@@ -468,12 +479,13 @@ def render_state_editor(selected_id, states, config, details, m_type, flow_state
         if not isinstance(current_tools, list):
             current_tools = []
         
-        # Combine available tools with any custom tools already in the state
-        all_tools = list(set(available_tools + current_tools))
+        # Combine available tools with any custom tools already in the state; dict.fromkeys dedupes
+        # in a stable order (so the widget keeps its identity across reruns) and every current tool is an option
+        all_tools = list(dict.fromkeys(available_tools + current_tools))
         new_tools = st.multiselect(
             "🔧 Tools",
             options=all_tools,
-            default=[t for t in current_tools if t in all_tools],
+            default=current_tools,
             help="Tools the agent can use"
         )
         
@@ -485,11 +497,11 @@ def render_state_editor(selected_id, states, config, details, m_type, flow_state
         if not isinstance(current_obs, list):
             current_obs = []
         
-        all_obs = list(set(available_observations + current_obs))
+        all_obs = list(dict.fromkeys(available_observations + current_obs))
         new_obs = st.multiselect(
             "👁️ Observations",
             options=all_obs,
-            default=[o for o in current_obs if o in all_obs],
+            default=current_obs,
             help="Data fields available to the agent"
         )
         
@@ -514,6 +526,18 @@ def render_state_editor(selected_id, states, config, details, m_type, flow_state
 
     # Transitions Section
     st.divider()
+    render_transitions(selected_id, state_data, states, details, m_type, flow_state_key)
+    
+    # Delete State
+    st.divider()
+    if st.button("🗑️ Delete State", type="secondary", use_container_width=True, key=f"del_state_{selected_id}"):
+        delete_state(selected_id, states, details, m_type, flow_state_key)
+
+
+@st.fragment
+def render_transitions(selected_id, state_data, states, details, m_type, flow_state_key):
+    """Transition expanders of a state; a fragment of its own so picking targets/templates leaves the state form alone."""
+    
     st.subheader("🔗 Transitions")
     
     trans = state_data.get("state_transitions", {})
@@ -531,11 +555,6 @@ def render_state_editor(selected_id, states, config, details, m_type, flow_state
     # Error Transition
     with st.expander("⚠️ Error Transition"):
         render_error_transition(selected_id, trans, states, details, m_type, flow_state_key)
-    
-    # Delete State
-    st.divider()
-    if st.button("🗑️ Delete State", type="secondary", use_container_width=True, key=f"del_state_{selected_id}"):
-        delete_state(selected_id, states, details, m_type, flow_state_key)
 
 
 def render_condition_editor(cond, idx, state_id, details, m_type, flow_state_key, conditions):
@@ -546,10 +565,9 @@ def render_condition_editor(cond, idx, state_id, details, m_type, flow_state_key
     # Use a form for editing (prevents rerun on widget changes)
     with st.form(key=f"cond_form_{state_id}_{idx}"):
         # Template selector
-        template_labels = [t["label"] for t in CONDITION_TEMPLATES]
         selected_template = st.selectbox(
             "Template",
-            options=["-- Keep Current --"] + template_labels,
+            options=["-- Keep Current --"] + CONDITION_TEMPLATE_LABELS,
             key=f"tmpl_{state_id}_{idx}"
         )
         
@@ -570,7 +588,7 @@ def render_condition_editor(cond, idx, state_id, details, m_type, flow_state_key
         # Check if template was selected
         final_cond = new_cond
         if selected_template != "-- Keep Current --":
-            template = next(t["template"] for t in CONDITION_TEMPLATES if t["label"] == selected_template)
+            template = CONDITION_TEMPLATES_BY_LABEL[selected_template]
             if "{value}" in template and template_value:
                 final_cond = template.replace("{value}", template_value)
             elif template:
@@ -595,16 +613,14 @@ def render_condition_editor(cond, idx, state_id, details, m_type, flow_state_key
 def render_add_transition(state_id, states, details, m_type, flow_state_key):
     """Render UI for adding a new transition."""
     
-    possible_targets = list(states.keys()) + ["end", "error"]
-    possible_targets = [t for t in possible_targets if t != state_id]
+    possible_targets = ["", *(t for t in (*states, "end", "error") if t != state_id)]
     
-    target = st.selectbox("Target State", options=[""] + possible_targets, key=f"new_trans_target_{state_id}")
+    target = st.selectbox("Target State", options=possible_targets, key=f"new_trans_target_{state_id}")
     
     # Template selector
-    template_labels = [t["label"] for t in CONDITION_TEMPLATES]
-    selected_template = st.selectbox("Condition Template", options=template_labels, key=f"new_trans_tmpl_{state_id}")
+    selected_template = st.selectbox("Condition Template", options=CONDITION_TEMPLATE_LABELS, key=f"new_trans_tmpl_{state_id}")
     
-    template = next(t["template"] for t in CONDITION_TEMPLATES if t["label"] == selected_template)
+    template = CONDITION_TEMPLATES_BY_LABEL[selected_template]
     
     condition = template
     if "{value}" in template:
@@ -632,7 +648,7 @@ def render_error_transition(state_id, trans, states, details, m_type, flow_state
     """Render error transition editor."""
     
     err = trans.get("error", {})
-    possible_targets = [""] + list(states.keys()) + ["end", "error"]
+    possible_targets = ["", *states, "end", "error"]
     current_target = err.get("next_state", "")
     
     try:
@@ -741,8 +757,8 @@ def render_create_state_panel(states, config, details, m_type, flow_state_key, s
                     new_state_data["observations"] = ["plan"]
                     new_state_data["state_transitions"]["conditions"] = [{"condition": "True", "next_state": "end"}]
                 elif template == "Copy Selected" and selected_id and selected_id in states:
-                    import copy
-                    new_state_data = copy.deepcopy(states[selected_id])
+                    # Transitions are not copied, so that subtree is left out of the deepcopy
+                    new_state_data = copy.deepcopy({k: v for k, v in states[selected_id].items() if k != "state_transitions"})
                     new_state_data["state_transitions"] = {"conditions": []}
 
                 states[ns] = new_state_data
@@ -774,6 +790,19 @@ def render_create_state_panel(states, config, details, m_type, flow_state_key, s
                 st.rerun()
 
 
+def drop_transitions_to(states, targets):
+    """Remove every condition and error transition leading into `targets` (a set of state ids), in one pass."""
+    for s_data in states.values():
+        t = s_data.get("state_transitions") if s_data else None
+        if not t:
+            continue
+        if "conditions" in t:
+            t["conditions"] = [c for c in t["conditions"] if c.get("next_state") not in targets]
+        err = t.get("error")
+        if err and err.get("next_state") in targets:
+            del t["error"]
+
+
 def delete_state(state_id, states, details, m_type, flow_state_key):
     """Delete a state and clean up references."""
     
@@ -781,15 +810,7 @@ def delete_state(state_id, states, details, m_type, flow_state_key):
         del states[state_id]
         
         # Remove transitions pointing to this state
-        for s_name, s_data in states.items():
-            if s_data:
-                t = s_data.get("state_transitions", {})
-                conds = t.get("conditions", [])
-                s_data["state_transitions"]["conditions"] = [
-                    c for c in conds if c.get("next_state") != state_id
-                ]
-                if t.get("error", {}).get("next_state") == state_id:
-                    del t["error"]
+        drop_transitions_to(states, {state_id})
         
         # Remove from positions
         if "ui_metadata" in details and "positions" in details["ui_metadata"]:
@@ -811,18 +832,23 @@ def handle_new_edges(new_state, original_edges, states, details, m_type):
     original_ids = {e.id for e in original_edges}
     changed = False
     
+    # New edges grouped by source, so each source's existing targets are collected once
+    new_targets = defaultdict(list)
     for edge in new_state.edges:
-        if edge.id not in original_ids:
-            src, tgt = edge.source, edge.target
-            if src in states:
-                trans = states[src].setdefault("state_transitions", {})
-                conds = trans.setdefault("conditions", [])
-                
-                if not any(c.get("next_state") == tgt for c in conds):
-                    conds.append({"condition": "True", "next_state": tgt})
-                    save_mission_type(m_type, details, prefer_yaml=True)
-                    st.toast(f"✨ Transition: {src} → {tgt}")
-                    changed = True
+        if edge.id not in original_ids and edge.source in states:
+            new_targets[edge.source].append(edge.target)
+    
+    for src, targets in new_targets.items():
+        trans = states[src].setdefault("state_transitions", {})
+        conds = trans.setdefault("conditions", [])
+        existing = {c.get("next_state") for c in conds}
+        
+        for tgt in targets:
+            if tgt not in existing:
+                conds.append({"condition": "True", "next_state": tgt})
+                existing.add(tgt)
+                st.toast(f"✨ Transition: {src} → {tgt}")
+                changed = True
     return changed
 
 
@@ -844,7 +870,6 @@ def handle_deleted_edges(new_state, original_edges, states, details, m_type):
                     if is_error:
                         if "error" in trans:
                             del trans["error"]
-                            save_mission_type(m_type, details, prefer_yaml=True)
                             st.toast("🗑️ Error transition removed")
                             changed = True
                     else:
@@ -852,7 +877,6 @@ def handle_deleted_edges(new_state, original_edges, states, details, m_type):
                         for idx, c in enumerate(conds):
                             if c.get("next_state") == tgt:
                                 conds.pop(idx)
-                                save_mission_type(m_type, details, prefer_yaml=True)
                                 st.toast(f"🗑️ Transition removed: {src} → {tgt}")
                                 changed = True
                                 break
@@ -860,29 +884,18 @@ def handle_deleted_edges(new_state, original_edges, states, details, m_type):
 
 
 def handle_deleted_nodes(new_state, original_nodes, states, details, m_type):
-    """Detect and remove nodes deleted visually."""
-    current_node_ids = {n.id for n in new_state.nodes}
-    changed = False
+    """Detect and remove nodes deleted visually, dropping every transition into them in one pass over the states."""
+    deleted = {n.id for n in original_nodes} - {n.id for n in new_state.nodes}
+    deleted &= states.keys()
+    if not deleted:
+        return False
     
-    for orig_node in original_nodes:
-        if orig_node.id not in current_node_ids:
-            if orig_node.id in states:
-                del states[orig_node.id]
-                for s_name, s_data in states.items():
-                    if s_data:
-                        t = s_data.get("state_transitions", {})
-                        conds = t.get("conditions", [])
-                        s_data["state_transitions"]["conditions"] = [
-                            c for c in conds if c.get("next_state") != orig_node.id
-                        ]
-                        if t.get("error", {}).get("next_state") == orig_node.id:
-                            del t["error"]
-                
-                if "ui_metadata" in details and "positions" in details["ui_metadata"]:
-                    if orig_node.id in details["ui_metadata"]["positions"]:
-                        del details["ui_metadata"]["positions"][orig_node.id]
-                
-                save_mission_type(m_type, details, prefer_yaml=True)
-                st.toast(f"🗑️ State '{orig_node.id}' removed")
-                changed = True
-    return changed
+    for node_id in deleted:
+        del states[node_id]
+        details.get("ui_metadata", {}).get("positions", {}).pop(node_id, None)
+    
+    drop_transitions_to(states, deleted)
+    
+    for node_id in sorted(deleted):
+        st.toast(f"🗑️ State '{node_id}' removed")
+    return True